@@ -236,9 +236,9 @@ async def get_job_logs(job_id: str):
         HTTPException: If job not found or log file doesn't exist
     """
     try:
-        # Verify job exists
-        job_data = await job_manager.get_job_with_config(job_id)
-        if not job_data:
+        # Verify job exists (the input/output config isn't needed here)
+        job = await job_manager.get_job(job_id)
+        if not job:
             raise HTTPException(
                 status_code=404,
                 detail={"message": f"Job {job_id} not found"}
@@ -300,9 +300,9 @@ async def get_job_log_tail(
         HTTPException: If job not found or log file doesn't exist
     """
     try:
-        # Verify job exists
-        job_data = await job_manager.get_job_with_config(job_id)
-        if not job_data:
+        # Verify job exists (the input/output config isn't needed here)
+        job = await job_manager.get_job(job_id)
+        if not job:
             raise HTTPException(
                 status_code=404,
                 detail={"message": f"Job {job_id} not found"}
@@ -359,9 +359,9 @@ async def download_job_log(job_id: str):
         HTTPException: If job not found or log file doesn't exist
     """
     try:
-        # Verify job exists
-        job_data = await job_manager.get_job_with_config(job_id)
-        if not job_data:
+        # Verify job exists (the input/output config isn't needed here)
+        job = await job_manager.get_job(job_id)
+        if not job:
             raise HTTPException(
                 status_code=404,
                 detail={"message": f"Job {job_id} not found"}
@@ -376,7 +376,7 @@ async def download_job_log(job_id: str):
             )
 
         # Get job name for filename
-        job_name = job_data['job']['name'].replace(' ', '_').replace('/', '_')
+        job_name = job.name.replace(' ', '_').replace('/', '_')
         filename = f"{job_name}_{job_id}.log"
 
         return FileResponse(
@@ -1433,7 +1433,7 @@ async def probe_input_metadata(request_data: dict = Body(...)):
     - Duration, format, bitrate
     - Video/audio/subtitle tracks with codecs, resolutions, etc.
     """
-    from services.ffmpeg.probe import probe_input_file
+    from services.ffmpeg.probe import probe_input_file, probed_at_dt
     from utils.security import validate_input_path
 
     try:
@@ -1455,6 +1455,7 @@ async def probe_input_metadata(request_data: dict = Body(...)):
 
         # Probe file
         metadata = await probe_input_file(validated_path)
+        metadata["probed_at"] = probed_at_dt(metadata["probed_at"])
 
         return metadata
 
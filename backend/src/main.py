@@ -87,6 +87,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down FFmpeg Live Encoder API")
+    await db_service.close()
 
 app = FastAPI(
     title="FFmpeg Live Encoder API",
@@ -6,6 +6,7 @@ Maps between unified configuration format and legacy three-object format
 for backward compatibility during migration period.
 """
 
+from datetime import datetime
 from typing import Dict, Any, Optional, List
 import json
 import logging
@@ -13,6 +14,13 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _datetime_default(obj: Any) -> str:
+    """JSON serializer fallback for datetime objects"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
 class ConfigMapper:
     """
     Handles conversion between unified and legacy configuration formats.
@@ -472,18 +480,10 @@ class ConfigMapper:
             # Convert legacy format to unified format
             unified = ConfigMapper.to_unified_format(job_data)
 
-            # Handle datetime serialization
-            def json_serializer(obj):
-                """Custom JSON serializer for datetime objects"""
-                from datetime import datetime
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                raise TypeError(f"Type {type(obj)} not serializable")
-
             # Write to full_config column
             await db_connection.execute(
                 "UPDATE encoding_jobs SET full_config = ? WHERE id = ?",
-                (json.dumps(unified, default=json_serializer), job_id)
+                (json.dumps(unified, default=_datetime_default), job_id)
             )
             await db_connection.commit()
 
@@ -201,7 +201,7 @@ def build_ffmpeg_command(request: CreateJobRequest) -> List[str]:
         # - mpegts → Version 3 (H.264 compatible)
         # - fmp4 → Version 7 (HEVC/AV1 compatible)
         # Note: User can select either format; HEVC/AV1 work best with fMP4 but mpegts is also supported
-        segment_type = hls.segment_type if hasattr(hls, 'segment_type') else "mpegts"
+        segment_type = hls.segment_type
 
         cmd.extend(["-hls_segment_type", segment_type])
 
@@ -618,7 +618,7 @@ def build_variant_output(rendition: Rendition, hls_config, hardware_accel=None,
     args.extend(["-hls_time", str(hls_config.segment_duration)])
 
     # Segment type
-    segment_type = hls_config.segment_type if hasattr(hls_config, 'segment_type') else "mpegts"
+    segment_type = hls_config.segment_type
     args.extend(["-hls_segment_type", segment_type])
 
     if segment_type == "fmp4":
@@ -626,10 +626,10 @@ def build_variant_output(rendition: Rendition, hls_config, hardware_accel=None,
         args.extend(["-hls_fmp4_init_filename", "init.mp4"])
 
     # Playlist type
-    playlist_type = hls_config.playlist_type if hasattr(hls_config, 'playlist_type') else "vod"
+    playlist_type = hls_config.playlist_type
     if playlist_type == "live":
         # Live rolling window: use list_size + delete_segments without playlist_type
-        args.extend(["-hls_list_size", str(hls_config.playlist_size if hasattr(hls_config, 'playlist_size') else 5)])
+        args.extend(["-hls_list_size", str(hls_config.playlist_size)])
         args.extend(["-hls_flags", "delete_segments"])
     elif playlist_type == "event":
         args.extend(["-hls_playlist_type", "event"])
@@ -637,7 +637,7 @@ def build_variant_output(rendition: Rendition, hls_config, hardware_accel=None,
         args.extend(["-hls_playlist_type", "vod"])
 
     # Segment filename pattern
-    segment_pattern = hls_config.segment_pattern if hasattr(hls_config, 'segment_pattern') else "segment_%03d.ts"
+    segment_pattern = hls_config.segment_pattern
     args.extend(["-hls_segment_filename", f"{hls_config.output_dir}/{rendition.name}/{segment_pattern}"])
 
     # Output variant playlist
@@ -724,24 +724,18 @@ def build_abr_udp_command(request: CreateJobRequest, renditions) -> List[str]:
     base_pkt_size = 1316
 
     if base_udp:
-        # Parse base address, port, and get ttl/pkt_size from the UDPOutput object
-        import re
-        udp_url_str = base_udp.url if hasattr(base_udp, 'url') else str(base_udp)
-        udp_match = re.match(r'udp://([^:]+):(\d+)', udp_url_str)
-        if udp_match:
-            base_address = udp_match.group(1)
-            base_port = int(udp_match.group(2))
-        # Get ttl and pkt_size from the UDPOutput object attributes
-        if hasattr(base_udp, 'ttl'):
-            base_ttl = base_udp.ttl
-        if hasattr(base_udp, 'pkt_size'):
-            base_pkt_size = base_udp.pkt_size
+        # UDPOutput always carries address/port plus ttl/pkt_size defaults
+        base_address = base_udp.address
+        base_port = base_udp.port
+        base_ttl = base_udp.ttl
+        base_pkt_size = base_udp.pkt_size
 
     # Generate outputs for each variant
     for idx, rendition in enumerate(renditions):
         # Use rendition's output_url if specified, otherwise auto-increment from base
-        if hasattr(rendition, 'output_url') and rendition.output_url:
-            udp_url = rendition.output_url
+        output_url = getattr(rendition, 'output_url', None)
+        if output_url:
+            udp_url = output_url
         elif base_address and base_port:
             variant_port = base_port + idx
             udp_url = f"udp://{base_address}:{variant_port}?ttl={base_ttl}&pkt_size={base_pkt_size}"
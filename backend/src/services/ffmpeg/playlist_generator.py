@@ -4,13 +4,87 @@ HLS Master Playlist Generator
 Generates RFC 8216 compliant HLS master playlists for Adaptive Bitrate (ABR) streaming.
 """
 
-from typing import List
+import re
+from typing import Iterator, List
 from pathlib import Path
 from enum import Enum
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 from models.rendition import Rendition
 
 
+# Bitrate suffix multipliers (k/K, m/M, g/G)
+_BITRATE_MULTIPLIERS = {
+    'k': 1_000,
+    'm': 1_000_000,
+    'g': 1_000_000_000,
+}
+
+# Bitrate string: decimal mantissa, optional k/m/g prefix, optional bps unit
+# (e.g., "5M", "0.5M", ".5M", "128k", "2.4Mbps", "0.125 Gbps", "1500000")
+_BITRATE_RE = re.compile(r'^\s*(\d*\.?\d+)\s*([kmg])?(?:bps|bit/s)?\s*$', re.IGNORECASE)
+
+# Upper bound on threads used to finalize variant playlists in parallel
+_FINALIZE_MAX_WORKERS = 8
+
+
+# FFmpeg encoder names normalized to codec names for RFC 6381 compliance
+_ENCODER_TO_CODEC = {
+    "libx264": "h264",
+    "libx265": "h265",
+    "libaom-av1": "av1",
+    "libvpx": "vp8",
+    "libvpx-vp9": "vp9",
+}
+
+# Video codec strings (RFC 6381), keyed by codec then profile
+_VIDEO_CODECS = {
+    "h264": {
+        "baseline": "avc1.42001e",  # Baseline Profile Level 3.0
+        "main": "avc1.64001f",      # Main Profile Level 3.1
+        "high": "avc1.640028",      # High Profile Level 4.0
+    },
+    "h265": {
+        "main": "hvc1.1.6.L120.90",  # Main Profile, Level 4
+        "main10": "hvc1.2.4.L120.90"  # Main 10 Profile
+    },
+    "av1": {
+        "main": "av01.0.05M.08",  # Main Profile, Level 3.1
+    }
+}
+
+# Flattened (codec, profile) -> codec string, plus the per-codec fallback
+# used when the profile is unknown (first listed profile)
+_VIDEO_CODEC_STRINGS = {
+    (codec, profile): codec_str
+    for codec, profiles in _VIDEO_CODECS.items()
+    for profile, codec_str in profiles.items()
+}
+_VIDEO_CODEC_DEFAULTS = {
+    codec: next(iter(profiles.values()))
+    for codec, profiles in _VIDEO_CODECS.items()
+}
+
+# Audio codec strings
+_AUDIO_CODEC_STRINGS = {
+    "aac": "mp4a.40.2",    # AAC-LC
+    "mp3": "mp4a.69",       # MP3
+    "opus": "opus",         # Opus
+    "ac3": "ac-3",          # AC-3
+    "eac3": "ec-3"          # E-AC-3
+}
+
+# EXT-X-STREAM-INF tag followed by the relative variant playlist path
+_STREAM_INF_TEMPLATE = (
+    '#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},RESOLUTION={resolution},CODECS="{codecs}"\n'
+    '{name}/index.m3u8\n'
+)
+
+# Read size used when scanning a master playlist for required tags
+_VALIDATE_CHUNK_SIZE = 4096
+
+
 class PlaylistType(Enum):
     """HLS Playlist types according to RFC 8216."""
     LIVE = "LIVE"     # No explicit tag - default for live streams
@@ -57,32 +131,42 @@ def generate_master_playlist(renditions: List[Rendition], output_dir: Path) -> P
 
     master_path = output_dir / "master.m3u8"
 
-    with open(master_path, "w", encoding="utf-8") as f:
-        # Write header
-        f.write("#EXTM3U\n")
-        f.write("#EXT-X-VERSION:3\n")
+    # Write the whole playlist in one call instead of per-line writes
+    master_path.write_text("".join(iter_master_playlist(renditions)), encoding="utf-8")
 
-        # Write variant playlists
-        for rendition in renditions:
-            # Calculate total bandwidth (video + audio)
-            bandwidth = calculate_total_bandwidth(rendition)
+    return master_path
 
-            # Parse resolution
-            resolution = rendition.video_resolution  # e.g., "1920x1080"
 
-            # Generate codec string (RFC 6381 format)
-            codecs = generate_codec_string(rendition)
+def iter_master_playlist(renditions: List[Rendition]) -> Iterator[str]:
+    """
+    Yield the HLS master playlist content chunk by chunk.
 
-            # Write EXT-X-STREAM-INF tag
-            f.write(
-                f"#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},"
-                f"RESOLUTION={resolution},CODECS=\"{codecs}\"\n"
-            )
+    Yields the header followed by one EXT-X-STREAM-INF entry (tag line plus
+    relative variant playlist path) per rendition, so callers can stream the
+    playlist without materializing it.
 
-            # Write variant playlist path (relative)
-            f.write(f"{rendition.name}/index.m3u8\n")
+    Args:
+        renditions: List of Rendition objects representing quality variants
 
-    return master_path
+    Yields:
+        Playlist text chunks, each ending with a newline
+
+    Example:
+        >>> "".join(iter_master_playlist(renditions))
+        '#EXTM3U\\n#EXT-X-VERSION:3\\n#EXT-X-STREAM-INF:BANDWIDTH=5128000,...'
+    """
+    # Header
+    yield "#EXTM3U\n"
+    yield "#EXT-X-VERSION:3\n"
+
+    # BANDWIDTH is video + audio, RESOLUTION is e.g. "1920x1080", CODECS is RFC 6381
+    for rendition in renditions:
+        yield _STREAM_INF_TEMPLATE.format(
+            bandwidth=calculate_total_bandwidth(rendition),
+            resolution=rendition.video_resolution,
+            codecs=generate_codec_string(rendition),
+            name=rendition.name,
+        )
 
 
 def calculate_total_bandwidth(rendition: Rendition) -> int:
@@ -111,11 +195,17 @@ def calculate_total_bandwidth(rendition: Rendition) -> int:
     return video_bps + audio_bps
 
 
+@lru_cache(maxsize=256)
 def bitrate_to_bps(bitrate: str) -> int:
     """
     Convert bitrate string to bits per second.
 
-    Supports suffixes: k/K (kilobits), m/M (megabits), g/G (gigabits)
+    Supports suffixes: k/K (kilobits), m/M (megabits), g/G (gigabits),
+    optionally followed by a "bps" unit and surrounded by whitespace.
+
+    Results are memoized: bitrates come from a small set of ladder values
+    ("5M", "128k", ...) and are parsed for every rendition on each master
+    playlist generation.
 
     Args:
         bitrate: Bitrate string (e.g., "5M", "3000k", "1500000")
@@ -123,6 +213,9 @@ def bitrate_to_bps(bitrate: str) -> int:
     Returns:
         Bitrate in bits per second
 
+    Raises:
+        ValueError: If the bitrate string cannot be parsed
+
     Example:
         >>> bitrate_to_bps("5M")
         5000000
@@ -130,21 +223,21 @@ def bitrate_to_bps(bitrate: str) -> int:
         3000000
         >>> bitrate_to_bps("1500000")
         1500000
+        >>> bitrate_to_bps("2.4Mbps")
+        2400000
+        >>> bitrate_to_bps(".5M")
+        500000
     """
     if not bitrate or bitrate == "0":
         return 0
 
-    suffix = bitrate[-1].lower()
+    match = _BITRATE_RE.match(bitrate)
+    if not match:
+        raise ValueError(f"Invalid bitrate format: {bitrate}")
 
-    if suffix == 'k':
-        return int(float(bitrate[:-1]) * 1000)
-    elif suffix == 'm':
-        return int(float(bitrate[:-1]) * 1000000)
-    elif suffix == 'g':
-        return int(float(bitrate[:-1]) * 1000000000)
-    else:
-        # Plain number (bits per second)
-        return int(bitrate)
+    # No prefix means a plain number (bits per second)
+    multiplier = _BITRATE_MULTIPLIERS.get((match.group(2) or '').lower(), 1)
+    return int(float(match.group(1)) * multiplier)
 
 
 def generate_codec_string(rendition: Rendition) -> str:
@@ -172,54 +265,33 @@ def generate_codec_string(rendition: Rendition) -> str:
         >>> generate_codec_string(rendition)
         'avc1.640028,mp4a.40.2'
     """
-    video_codec = rendition.video_codec or "h264"
-    audio_codec = rendition.audio_codec or "aac"
-    video_profile = rendition.video_profile or "main"
+    return _codec_string(
+        rendition.video_codec or "h264",
+        rendition.video_profile or "main",
+        rendition.audio_codec or "aac",
+    )
 
-    # Normalize FFmpeg encoder names to codec names for RFC 6381 compliance
-    codec_mapping = {
-        "libx264": "h264",
-        "libx265": "h265",
-        "libaom-av1": "av1",
-        "libvpx": "vp8",
-        "libvpx-vp9": "vp9",
-    }
-    video_codec = codec_mapping.get(video_codec, video_codec)
-
-    # Video codec strings (RFC 6381)
-    video_codecs = {
-        "h264": {
-            "baseline": "avc1.42001e",  # Baseline Profile Level 3.0
-            "main": "avc1.64001f",      # Main Profile Level 3.1
-            "high": "avc1.640028",      # High Profile Level 4.0
-        },
-        "h265": {
-            "main": "hvc1.1.6.L120.90",  # Main Profile, Level 4
-            "main10": "hvc1.2.4.L120.90"  # Main 10 Profile
-        },
-        "av1": {
-            "main": "av01.0.05M.08",  # Main Profile, Level 3.1
-        }
-    }
 
-    # Audio codec strings
-    audio_codecs = {
-        "aac": "mp4a.40.2",    # AAC-LC
-        "mp3": "mp4a.69",       # MP3
-        "opus": "opus",         # Opus
-        "ac3": "ac-3",          # AC-3
-        "eac3": "ec-3"          # E-AC-3
-    }
+@lru_cache(maxsize=64)
+def _codec_string(video_codec: str, video_profile: str, audio_codec: str) -> str:
+    """
+    Resolve the RFC 6381 codec string for normalized codec attributes.
+
+    Memoized on the (video_codec, video_profile, audio_codec) tuple since a
+    deployment only uses a handful of distinct combinations.
+    """
+    # Normalize FFmpeg encoder names to codec names for RFC 6381 compliance
+    video_codec = _ENCODER_TO_CODEC.get(video_codec, video_codec)
 
-    # Get video codec string
-    if video_codec in video_codecs:
-        video_str = video_codecs[video_codec].get(video_profile, list(video_codecs[video_codec].values())[0])
-    else:
-        # Fallback for unknown codecs
-        video_str = f"{video_codec}.unknown"
+    # Get video codec string (profile-specific, then codec default, then unknown)
+    video_str = (
+        _VIDEO_CODEC_STRINGS.get((video_codec, video_profile))
+        or _VIDEO_CODEC_DEFAULTS.get(video_codec)
+        or f"{video_codec}.unknown"
+    )
 
     # Get audio codec string
-    audio_str = audio_codecs.get(audio_codec, "mp4a.40.2")
+    audio_str = _AUDIO_CODEC_STRINGS.get(audio_codec, "mp4a.40.2")
 
     return f"{video_str},{audio_str}"
 
@@ -242,21 +314,26 @@ def validate_master_playlist(master_path: Path) -> bool:
     if not master_path.exists():
         return False
 
-    try:
-        with open(master_path, "r", encoding="utf-8") as f:
-            content = f.read()
+    # Required header and at least one stream info tag. Both normally appear in
+    # the first few hundred bytes, so scan in chunks and stop once both are seen.
+    missing = {b"#EXTM3U", b"#EXT-X-STREAM-INF"}
+    overlap = max(len(marker) for marker in missing) - 1
 
-            # Check for required headers
-            if "#EXTM3U" not in content:
-                return False
+    try:
+        with open(master_path, "rb") as f:
+            window = b""
+            while missing:
+                chunk = f.read(_VALIDATE_CHUNK_SIZE)
+                if not chunk:
+                    return False
 
-            # Check for at least one stream info tag
-            if "#EXT-X-STREAM-INF" not in content:
-                return False
+                # Keep the previous chunk's tail so markers split across reads match
+                window = window[-overlap:] + chunk
+                missing = {marker for marker in missing if marker not in window}
 
             return True
 
-    except (IOError, UnicodeDecodeError):
+    except IOError:
         return False
 
 
@@ -285,43 +362,45 @@ def finalize_variant_playlist(playlist_path: Path, playlist_type: PlaylistType)
     if not playlist_path.exists():
         raise FileNotFoundError(f"Variant playlist not found: {playlist_path}")
 
-    # Read existing playlist
-    with open(playlist_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
     # For LIVE playlists, no modification needed
     if playlist_type == PlaylistType.LIVE:
         return
 
-    # Find insertion point for playlist type tag (after #EXT-X-VERSION or #EXTM3U)
-    modified_lines = []
+    # Read existing playlist
+    with open(playlist_path, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+
+    # Insert playlist type tag after #EXT-X-VERSION, or after #EXTM3U when
+    # the playlist has no version tag
+    header_prefix = (
+        "#EXT-X-VERSION"
+        if any(line.startswith("#EXT-X-VERSION") for line in lines)
+        else "#EXTM3U"
+    )
+    type_tag = f"#EXT-X-PLAYLIST-TYPE:{playlist_type.value}\n"
+
+    # For VOD and EVENT (completed), #EXT-X-ENDLIST must be at the end only once,
+    # so existing ones are dropped in the same pass
+    parts = []
     type_tag_inserted = False
 
     for line in lines:
-        modified_lines.append(line)
-
-        # Insert playlist type tag after version tag or M3U header
-        if not type_tag_inserted and (
-            line.startswith("#EXT-X-VERSION") or
-            (line.startswith("#EXTM3U") and not any(l.startswith("#EXT-X-VERSION") for l in lines))
-        ):
-            modified_lines.append(f"#EXT-X-PLAYLIST-TYPE:{playlist_type.value}\n")
-            type_tag_inserted = True
+        if line.startswith("#EXT-X-ENDLIST"):
+            continue
+
+        parts.append(line)
 
-    # For VOD and EVENT (completed), ensure #EXT-X-ENDLIST is at the end
-    # LIVE playlists should NOT have ENDLIST (they're ongoing)
-    if playlist_type in (PlaylistType.VOD, PlaylistType.EVENT):
-        # Remove any existing #EXT-X-ENDLIST
-        modified_lines = [line for line in modified_lines if not line.startswith("#EXT-X-ENDLIST")]
+        if not type_tag_inserted and line.startswith(header_prefix):
+            parts.append(type_tag)
+            type_tag_inserted = True
 
-        # Add #EXT-X-ENDLIST at the end
-        if modified_lines and not modified_lines[-1].endswith("\n"):
-            modified_lines[-1] += "\n"
-        modified_lines.append("#EXT-X-ENDLIST\n")
+    # Add #EXT-X-ENDLIST at the end
+    if parts and not parts[-1].endswith("\n"):
+        parts[-1] += "\n"
+    parts.append("#EXT-X-ENDLIST\n")
 
     # Write modified playlist back
-    with open(playlist_path, "w", encoding="utf-8") as f:
-        f.writelines(modified_lines)
+    playlist_path.write_text("".join(parts), encoding="utf-8")
 
 
 def finalize_all_variant_playlists(
@@ -333,7 +412,8 @@ def finalize_all_variant_playlists(
     Finalize all variant playlists for a job with the appropriate playlist type.
 
     This function should be called after FFmpeg has finished generating the HLS
-    segments and playlists to add the proper type tags.
+    segments and playlists to add the proper type tags. Variant playlists are
+    finalized concurrently in a thread pool.
 
     Args:
         output_dir: Base output directory containing rendition subdirectories
@@ -358,6 +438,17 @@ def finalize_all_variant_playlists(
         ...     PlaylistType.VOD
         ... )
     """
-    for rendition in renditions:
-        variant_playlist = output_dir / rendition.name / "index.m3u8"
-        finalize_variant_playlist(variant_playlist, playlist_type)
+    if not renditions:
+        return
+
+    def finalize(rendition: Rendition) -> None:
+        finalize_variant_playlist(output_dir / rendition.name / "index.m3u8", playlist_type)
+
+    if len(renditions) == 1:
+        finalize(renditions[0])
+        return
+
+    # Each variant playlist is independent file I/O, so finalize them concurrently.
+    # Consuming the map results re-raises the first worker exception.
+    with ThreadPoolExecutor(max_workers=min(len(renditions), _FINALIZE_MAX_WORKERS)) as executor:
+        list(executor.map(finalize, renditions))
@@ -6,21 +6,46 @@ such as duration, codecs, tracks, resolution, etc.
 """
 
 import asyncio
-import json
+import copy
 import logging
-from typing import Dict, List
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+
+import orjson
+
+from .process import kill_process
 
 logger = logging.getLogger(__name__)
 
+# Probe results keyed by (file_path, st_mtime_ns, st_size). A modified file
+# gets a new key, so entries never need explicit invalidation.
+_PROBE_CACHE: "OrderedDict[Tuple[str, int, int], Dict]" = OrderedDict()
+_PROBE_CACHE_MAX_SIZE = 1024
+
+# FFprobe fields read by probe_input_file/extract_track_info. Requesting only
+# these instead of -show_format -show_streams keeps the JSON output small.
+_PROBE_ENTRIES = (
+    "format=duration,format_name,bit_rate"
+    ":stream=index,codec_type,codec_name,width,height,r_frame_rate,"
+    "channels,sample_rate,bit_rate"
+    ":stream_tags=language"
+)
 
-async def probe_input_file(file_path: str) -> Dict:
+
+async def probe_input_file(file_path: str, timeout: float = 30) -> Dict:
     """
     Probe media file and return metadata using FFprobe.
 
+    Results are cached in-process per (path, mtime, size), so re-probing an
+    unchanged file does not spawn FFprobe again.
+
     Args:
         file_path: Absolute path to input file
+        timeout: Seconds to wait for FFprobe before killing it
 
     Returns:
         Dictionary with metadata including:
@@ -30,7 +55,7 @@ async def probe_input_file(file_path: str) -> Dict:
         - size: int (bytes)
         - bitrate: str
         - tracks: List[Dict] (stream information)
-        - probed_at: datetime
+        - probed_at: int (epoch nanoseconds, see probed_at_dt)
 
     Raises:
         RuntimeError: If FFprobe fails
@@ -41,18 +66,25 @@ async def probe_input_file(file_path: str) -> Dict:
         >>> print(f"Duration: {metadata['duration']}s")
         >>> print(f"Tracks: {len(metadata['tracks'])}")
     """
-    # Validate file exists
-    file_path_obj = Path(file_path)
-    if not file_path_obj.exists():
+    # Validate file exists (single stat, size is reused below)
+    try:
+        file_stat = Path(file_path).stat()
+    except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    # Build FFprobe command
+    # Return cached metadata if the file is unchanged since the last probe
+    cache_key = (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _PROBE_CACHE.get(cache_key)
+    if cached is not None:
+        _PROBE_CACHE.move_to_end(cache_key)
+        return copy.deepcopy(cached)
+
+    # Build FFprobe command (only the fields consumed below are requested)
     cmd = [
         "ffprobe",
         "-v", "quiet",
         "-print_format", "json",
-        "-show_format",
-        "-show_streams",
+        "-show_entries", _PROBE_ENTRIES,
         file_path
     ]
 
@@ -66,42 +98,98 @@ async def probe_input_file(file_path: str) -> Dict:
 
         stdout, stderr = await asyncio.wait_for(
             proc.communicate(),
-            timeout=10  # 10 second timeout for probe
+            timeout=timeout
         )
 
         if proc.returncode != 0:
             error_msg = stderr.decode() if stderr else "Unknown error"
             raise RuntimeError(f"FFprobe failed: {error_msg}")
 
-        # Parse JSON output
-        probe_data = json.loads(stdout.decode())
+        # Parse JSON output (orjson accepts the raw bytes, no decode needed)
+        probe_data = orjson.loads(stdout)
 
         # Extract metadata
         format_info = probe_data.get("format", {})
-        file_size = file_path_obj.stat().st_size
 
         metadata = {
             "file_path": file_path,
             "duration": float(format_info.get("duration", 0)),
             "format": format_info.get("format_name"),
-            "size": file_size,
+            "size": file_stat.st_size,
             "bitrate": format_info.get("bit_rate"),
             "tracks": extract_track_info(probe_data),
-            "probed_at": datetime.utcnow()
+            "probed_at": time.time_ns()
         }
 
         logger.info(f"Probed {file_path}: {len(metadata['tracks'])} tracks, {metadata['duration']}s")
+
+        _PROBE_CACHE[cache_key] = copy.deepcopy(metadata)
+        if len(_PROBE_CACHE) > _PROBE_CACHE_MAX_SIZE:
+            _PROBE_CACHE.popitem(last=False)
+
         return metadata
 
     except asyncio.TimeoutError:
-        raise RuntimeError(f"FFprobe timed out after 10 seconds")
-    except json.JSONDecodeError as e:
+        # Don't leave a slow probe (e.g. large network-mounted file) running
+        await kill_process(proc)
+        raise RuntimeError(f"FFprobe timed out after {timeout} seconds")
+    except orjson.JSONDecodeError as e:
         raise RuntimeError(f"Failed to parse FFprobe output: {e}")
     except Exception as e:
         logger.error(f"Failed to probe {file_path}: {e}")
         raise
 
 
+async def probe_input_files(
+    file_paths: List[str],
+    concurrency: Optional[int] = None,
+    timeout: float = 30
+) -> List[Union[Dict, Exception]]:
+    """
+    Probe multiple media files concurrently.
+
+    Runs up to `concurrency` FFprobe processes at once. Failures are isolated
+    per file: the exception is returned in that file's slot instead of
+    aborting the whole batch.
+
+    Args:
+        file_paths: Absolute paths to input files
+        concurrency: Maximum concurrent probes (default: CPU count)
+        timeout: Per-file FFprobe timeout in seconds
+
+    Returns:
+        List in input order with a metadata dict (see probe_input_file) or
+        the exception raised for that file
+
+    Example:
+        >>> results = await probe_input_files(["/input/a.mp4", "/input/b.mp4"])
+        >>> ok = [r for r in results if not isinstance(r, Exception)]
+    """
+    semaphore = asyncio.Semaphore(concurrency or os.cpu_count() or 1)
+
+    async def probe_one(file_path: str) -> Dict:
+        async with semaphore:
+            return await probe_input_file(file_path, timeout=timeout)
+
+    return await asyncio.gather(
+        *(probe_one(file_path) for file_path in file_paths),
+        return_exceptions=True
+    )
+
+
+def probed_at_dt(probed_at_ns: int) -> datetime:
+    """
+    Convert a probe timestamp (epoch nanoseconds) to a UTC datetime.
+
+    Args:
+        probed_at_ns: "probed_at" value from probe_input_file metadata
+
+    Returns:
+        Timezone-aware UTC datetime
+    """
+    return datetime.fromtimestamp(probed_at_ns / 1e9, tz=timezone.utc)
+
+
 def extract_track_info(probe_data: Dict) -> List[Dict]:
     """
     Extract user-friendly track information from FFprobe data.
@@ -127,25 +215,44 @@ def extract_track_info(probe_data: Dict) -> List[Dict]:
             "language": stream.get("tags", {}).get("language", "unknown"),
         }
 
-        # Add video-specific fields
-        if stream.get("codec_type") == "video":
-            track["width"] = stream.get("width")
-            track["height"] = stream.get("height")
-
-            # Parse framerate (format: "30/1" or "24000/1001")
-            r_frame_rate = stream.get("r_frame_rate", "0/1")
-            try:
-                num, den = r_frame_rate.split("/")
-                track["fps"] = float(num) / float(den) if float(den) > 0 else 0
-            except:
-                track["fps"] = 0
-
-        # Add audio-specific fields
-        elif stream.get("codec_type") == "audio":
-            track["channels"] = stream.get("channels")
-            track["sample_rate"] = stream.get("sample_rate")
-            track["bitrate"] = stream.get("bit_rate")
+        # Add type-specific fields (video/audio); other stream types have none
+        extractor = _TRACK_FIELD_EXTRACTORS.get(stream.get("codec_type"))
+        if extractor:
+            track.update(extractor(stream))
 
         tracks.append(track)
 
     return tracks
+
+
+def _extract_video_fields(stream: Dict) -> Dict:
+    """Extract video-specific track fields (dimensions and framerate)."""
+    # Parse framerate (format: "30/1" or "24000/1001")
+    num, _, den = stream.get("r_frame_rate", "0/1").partition("/")
+    try:
+        den_value = int(den) if den else 1
+        fps = int(num) / den_value if den_value > 0 else 0
+    except ValueError:
+        fps = 0
+
+    return {
+        "width": stream.get("width"),
+        "height": stream.get("height"),
+        "fps": fps,
+    }
+
+
+def _extract_audio_fields(stream: Dict) -> Dict:
+    """Extract audio-specific track fields."""
+    return {
+        "channels": stream.get("channels"),
+        "sample_rate": stream.get("sample_rate"),
+        "bitrate": stream.get("bit_rate"),
+    }
+
+
+# codec_type -> extractor for the type-specific track fields
+_TRACK_FIELD_EXTRACTORS = {
+    "video": _extract_video_fields,
+    "audio": _extract_audio_fields,
+}
@@ -0,0 +1,14 @@
+"""
+Subprocess helpers shared by the FFmpeg/FFprobe service modules.
+"""
+
+import asyncio
+
+
+async def kill_process(proc: asyncio.subprocess.Process) -> None:
+    """Kill a timed-out subprocess and reap it so it doesn't linger."""
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        pass  # Already exited
+    await proc.wait()
@@ -9,7 +9,8 @@ This module defines 5 templates that cover common encoding scenarios:
 5. Fast Preview - quick low-quality encoding for previews
 """
 
-from typing import Dict, List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 from models.templates import Template, TemplateId, TemplateSummary
 
 
@@ -118,6 +119,43 @@ TEMPLATES: Dict[str, Template] = {
 }
 
 
+# ============================================================================
+# Precomputed Lookups
+# ============================================================================
+# Templates are static configuration, so summaries, the ID -> name mapping and
+# the tag index are built once at import instead of on every request.
+
+_SUMMARIES: Dict[str, TemplateSummary] = {
+    template_id: TemplateSummary(
+        id=template.id,
+        name=template.name,
+        description=template.description,
+        tags=template.tags,
+        recommended_use=template.recommended_use
+    )
+    for template_id, template in TEMPLATES.items()
+}
+
+_ALL_SUMMARIES: Tuple[TemplateSummary, ...] = tuple(_SUMMARIES.values())
+
+_NAMES: Dict[str, str] = {
+    template.id: template.name
+    for template in TEMPLATES.values()
+}
+
+# Inverted index: lowercased tag -> matching summaries (in template order).
+# Tags are deduplicated per template so case variants don't list it twice.
+def _build_tag_index() -> Dict[str, List[TemplateSummary]]:
+    index: Dict[str, List[TemplateSummary]] = defaultdict(list)
+    for template_id, template in TEMPLATES.items():
+        for tag in dict.fromkeys(t.lower() for t in template.tags):
+            index[tag].append(_SUMMARIES[template_id])
+    return dict(index)
+
+
+_TAG_INDEX: Dict[str, List[TemplateSummary]] = _build_tag_index()
+
+
 # ============================================================================
 # Template Service Functions
 # ============================================================================
@@ -129,16 +167,7 @@ def get_all_templates() -> List[TemplateSummary]:
     Returns:
         List of template summaries (lightweight, no full encoding settings)
     """
-    return [
-        TemplateSummary(
-            id=template.id,
-            name=template.name,
-            description=template.description,
-            tags=template.tags,
-            recommended_use=template.recommended_use
-        )
-        for template in TEMPLATES.values()
-    ]
+    return list(_ALL_SUMMARIES)
 
 
 def get_template_by_id(template_id: str) -> Optional[Template]:
@@ -174,10 +203,7 @@ def list_template_names() -> Dict[str, str]:
     Returns:
         Dict mapping template ID to display name
     """
-    return {
-        template.id: template.name
-        for template in TEMPLATES.values()
-    }
+    return dict(_NAMES)
 
 
 def search_templates_by_tag(tag: str) -> List[TemplateSummary]:
@@ -190,19 +216,4 @@ def search_templates_by_tag(tag: str) -> List[TemplateSummary]:
     Returns:
         List of matching template summaries
     """
-    tag_lower = tag.lower()
-    matching = [
-        template for template in TEMPLATES.values()
-        if tag_lower in [t.lower() for t in template.tags]
-    ]
-
-    return [
-        TemplateSummary(
-            id=template.id,
-            name=template.name,
-            description=template.description,
-            tags=template.tags,
-            recommended_use=template.recommended_use
-        )
-        for template in matching
-    ]
+    return list(_TAG_INDEX.get(tag.lower(), ()))
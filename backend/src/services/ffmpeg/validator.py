@@ -7,14 +7,42 @@ to catch errors before job creation.
 
 import asyncio
 import logging
-from typing import List, Tuple
+import re
+import time
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+from .process import kill_process
 
 logger = logging.getLogger(__name__)
 
+# Hardware acceleration availability is a static property of the host, so
+# results are cached and refreshed after a TTL (e.g. in case drivers are
+# installed while the backend is running).
+_HWACCEL_CACHE_TTL = 3600  # seconds
+
+# Compiled-in hwaccel methods reported by `ffmpeg -hwaccels`: (methods, checked_at)
+_HWACCEL_METHODS_CACHE: Optional[Tuple[FrozenSet[str], float]] = None
+_HWACCEL_METHODS_LOCK = asyncio.Lock()
+
+# Runtime encode-test results: hwaccel -> (available, checked_at)
+_HWACCEL_RUNTIME_CACHE: Dict[str, Tuple[bool, float]] = {}
+_HWACCEL_RUNTIME_LOCKS: Dict[str, asyncio.Lock] = {}
+
+# Job hardware_accel values whose FFmpeg -hwaccel method name differs
+_HWACCEL_METHOD_NAMES = {
+    "nvenc": "cuda",
+}
+
+# FFmpeg errors usually contain these keywords (case-insensitive)
+_ERROR_KEYWORDS_RE = re.compile(r"error|invalid|unknown|failed|not found", re.IGNORECASE)
+
+# Maximum dry-run stderr kept for error extraction
+_STDERR_TAIL_LIMIT = 65536
+
 
 async def dry_run_ffmpeg(cmd: List[str], timeout: int = 2) -> Tuple[bool, str]:
     """
-    Validate FFmpeg command by running with null output and 1-second limit.
+    Validate FFmpeg command by encoding a single frame to null output.
 
     This executes a short version of the command to validate:
     - Command syntax is correct
@@ -38,59 +66,73 @@ async def dry_run_ffmpeg(cmd: List[str], timeout: int = 2) -> Tuple[bool, str]:
         >>>     print("Command is valid!")
     """
     try:
-        # Build dry-run command
-        # Strategy: Use -f null output with -t 1 (1 second duration limit)
-        dry_run_cmd = ["ffmpeg"]
-
-        # Find input position
-        try:
-            input_idx = cmd.index("-i")
-        except ValueError:
+        # Build dry-run command in a single pass over the original:
+        # options up to and including the input file, a single-frame limit,
+        # then the encoding options. The final positional argument (output
+        # path) is dropped and replaced by a null output. Only errors are
+        # logged and ffmpeg exits on the first one.
+        dry_run_cmd = ["ffmpeg", "-loglevel", "error", "-xerror", "-nostats"]
+        input_idx = None
+        output_idx = len(cmd) - 1
+        is_hls = False
+
+        for idx in range(1, len(cmd)):
+            token = cmd[idx]
+
+            if input_idx is None:
+                dry_run_cmd.append(token)
+                if token == "-i":
+                    input_idx = idx
+            elif idx == input_idx + 1:
+                # Input file, then stop after the first video frame; -t 1 still
+                # bounds audio-only outputs that have no video frames to count
+                dry_run_cmd.append(token)
+                dry_run_cmd.extend(["-frames:v", "1", "-t", "1"])
+            elif idx == output_idx:
+                break
+            else:
+                dry_run_cmd.append(token)
+                # Check if this is HLS output (-f hls)
+                if token == "-f" and idx + 1 < len(cmd) and cmd[idx + 1] == "hls":
+                    is_hls = True
+                    break
+
+        if input_idx is None:
             return False, "No input file specified in command"
 
-        # Copy up to and including input file
-        dry_run_cmd.extend(cmd[1:input_idx + 2])
-
-        # Add 1-second duration limit to avoid long processing
-        dry_run_cmd.extend(["-t", "1"])
-
-        # Copy encoding options (between input and output)
-        output_path = cmd[-1]
-        encoding_opts = cmd[input_idx + 2:-1]
-        dry_run_cmd.extend(encoding_opts)
-
-        # Check if this is HLS output (has -f hls flag)
-        is_hls = '-f' in encoding_opts and 'hls' in encoding_opts
-
         if is_hls:
             # For HLS, we can't use null output - skip dry-run validation
             # HLS validation requires actual directory creation which we don't want in preview
             logger.info("Skipping dry-run for HLS output (requires directory creation)")
             return True, ""
-        else:
-            # Use null output (no actual file written)
-            dry_run_cmd.extend(["-f", "null", "-"])
+
+        # Use null output (no actual file written)
+        dry_run_cmd.extend(["-f", "null", "-"])
 
         logger.debug(f"Dry-run command: {' '.join(dry_run_cmd)}")
 
-        # Execute dry-run
+        # Execute dry-run (null muxer writes nothing useful to stdout)
         proc = await asyncio.create_subprocess_exec(
             *dry_run_cmd,
-            stdout=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE
         )
 
-        stdout, stderr = await asyncio.wait_for(
-            proc.communicate(),
-            timeout=timeout
-        )
+        try:
+            stderr = await asyncio.wait_for(
+                _read_stderr_tail(proc),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            await kill_process(proc)
+            raise
 
         if proc.returncode == 0:
             logger.info("Dry-run validation passed")
             return True, ""
         else:
             # Parse FFmpeg error message
-            error = extract_ffmpeg_error(stderr.decode())
+            error = extract_ffmpeg_error(stderr)
             logger.warning(f"Dry-run validation failed: {error}")
             return False, error
 
@@ -101,15 +143,43 @@ async def dry_run_ffmpeg(cmd: List[str], timeout: int = 2) -> Tuple[bool, str]:
         return False, f"Validation error: {str(e)}"
 
 
-def extract_ffmpeg_error(stderr: str) -> str:
+async def _read_stderr_tail(proc: asyncio.subprocess.Process) -> bytes:
+    """
+    Drain a process's stderr until exit, keeping only the last bytes.
+
+    FFmpeg reports errors at the end of its output, so memory stays bounded
+    by _STDERR_TAIL_LIMIT no matter how verbose the process is.
+    """
+    tail = b""
+    while True:
+        chunk = await proc.stderr.read(_STDERR_TAIL_LIMIT)
+        if not chunk:
+            break
+        tail = (tail + chunk)[-_STDERR_TAIL_LIMIT:]
+
+    await proc.wait()
+    return tail
+
+
+def _iter_lines_reverse(buf: bytes) -> Iterator[bytes]:
+    """Yield the lines of buf from last to first without splitting it all."""
+    end = len(buf)
+    while end > 0:
+        start = buf.rfind(b"\n", 0, end)
+        yield buf[start + 1:end]
+        end = start
+
+
+def extract_ffmpeg_error(stderr: Union[str, bytes]) -> str:
     """
     Extract user-friendly error message from FFmpeg stderr output.
 
     FFmpeg outputs verbose information to stderr. This function
-    extracts the relevant error message.
+    extracts the relevant error message, scanning backwards from the end
+    so only the tail of a long stderr is ever decoded.
 
     Args:
-        stderr: FFmpeg stderr output
+        stderr: FFmpeg stderr output (raw bytes or decoded text)
 
     Returns:
         Extracted error message (or last line if no obvious error)
@@ -122,30 +192,33 @@ def extract_ffmpeg_error(stderr: str) -> str:
     if not stderr:
         return "Unknown FFmpeg error"
 
-    # FFmpeg errors usually contain these keywords
-    error_keywords = ["error", "invalid", "unknown", "failed", "not found"]
-
-    # Search for lines containing error keywords (reversed to get most recent)
-    lines = stderr.strip().split('\n')
-    for line in reversed(lines):
-        line_lower = line.lower()
-        if any(keyword in line_lower for keyword in error_keywords):
-            return line.strip()
+    if isinstance(stderr, str):
+        stderr = stderr.encode("utf-8", errors="replace")
+
+    # Search for lines containing error keywords (most recent first),
+    # remembering the last non-empty line as a fallback
+    fallback = None
+    for raw_line in _iter_lines_reverse(stderr):
+        line = raw_line.decode("utf-8", errors="replace").strip()
+        if not line:
+            continue
+        if _ERROR_KEYWORDS_RE.search(line):
+            return line
+        if fallback is None and not line.startswith("ffmpeg version"):
+            fallback = line
 
     # If no obvious error, return last non-empty line
-    for line in reversed(lines):
-        if line.strip() and not line.strip().startswith("ffmpeg version"):
-            return line.strip()
-
-    return "Unknown FFmpeg error"
+    return fallback or "Unknown FFmpeg error"
 
 
 async def check_hwaccel_available(hwaccel: str) -> bool:
     """
     Check if hardware acceleration is available on the system.
 
-    Tests hardware acceleration by attempting to use it with FFmpeg.
-    Uses a short test to avoid delays.
+    Looks the method up in the capability list reported by
+    `ffmpeg -hwaccels`, which needs no codec or device initialization. The
+    list is fetched once and cached for an hour. Use verify_hwaccel_runtime()
+    when the device must actually be usable (e.g. driver libraries present).
 
     Args:
         hwaccel: Hardware acceleration type (none, nvenc, vaapi)
@@ -162,28 +235,135 @@ async def check_hwaccel_available(hwaccel: str) -> bool:
     if hwaccel == "none" or not hwaccel:
         return True
 
+    methods = await _list_hwaccels()
+    available = _HWACCEL_METHOD_NAMES.get(hwaccel, hwaccel) in methods
+    logger.debug(f"Hardware acceleration '{hwaccel}' available: {available}")
+    return available
+
+
+async def check_hwaccels_available(hwaccels: List[str]) -> Dict[str, bool]:
+    """
+    Check several hardware acceleration types concurrently.
+
+    Args:
+        hwaccels: Hardware acceleration types (e.g. ["nvenc", "vaapi", "qsv"])
+
+    Returns:
+        Dict mapping each hwaccel to its availability
+
+    Example:
+        >>> await check_hwaccels_available(["nvenc", "vaapi"])
+        {'nvenc': True, 'vaapi': False}
+    """
+    results = await asyncio.gather(*(check_hwaccel_available(h) for h in hwaccels))
+    return dict(zip(hwaccels, results))
+
+
+async def _list_hwaccels() -> FrozenSet[str]:
+    """Return the hwaccel methods FFmpeg was built with (cached)."""
+    global _HWACCEL_METHODS_CACHE
+
+    async with _HWACCEL_METHODS_LOCK:
+        if (
+            _HWACCEL_METHODS_CACHE is not None
+            and time.monotonic() - _HWACCEL_METHODS_CACHE[1] < _HWACCEL_CACHE_TTL
+        ):
+            return _HWACCEL_METHODS_CACHE[0]
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-hide_banner", "-hwaccels",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=2)
+            except asyncio.TimeoutError:
+                await kill_process(proc)
+                raise
+
+            if proc.returncode != 0:
+                logger.warning(f"ffmpeg -hwaccels exited with code {proc.returncode}")
+                return frozenset()
+
+            # Output: "Hardware acceleration methods:" header, then one method per line
+            _, _, method_list = stdout.decode(errors="ignore").partition(":")
+            methods = frozenset(line.strip() for line in method_list.splitlines() if line.strip())
+            logger.info(f"FFmpeg hardware acceleration methods: {sorted(methods)}")
+
+        except asyncio.TimeoutError:
+            logger.warning("Listing FFmpeg hardware acceleration methods timed out (>2s)")
+            return frozenset()
+        except Exception as e:
+            logger.error(f"Error listing FFmpeg hardware acceleration methods: {e}")
+            return frozenset()
+
+        # Only a successful listing is cached; failures are retried on the next call
+        _HWACCEL_METHODS_CACHE = (methods, time.monotonic())
+        return methods
+
+
+async def verify_hwaccel_runtime(hwaccel: str) -> bool:
+    """
+    Verify that hardware acceleration can actually be initialized.
+
+    Runs a short synthetic encode with the hwaccel, which creates the device
+    context. This distinguishes "compiled in" from "usable" (e.g. a missing
+    driver library) at the cost of a slow probe. Results are cached for an
+    hour, and concurrent checks of the same hwaccel share a single probe.
+
+    Args:
+        hwaccel: Hardware acceleration type (none, nvenc, vaapi)
+
+    Returns:
+        True if hardware acceleration works at runtime, False otherwise
+    """
+    # 'none' is always available (software encoding)
+    if hwaccel == "none" or not hwaccel:
+        return True
+
+    # Serialize checks per hwaccel so concurrent callers wait for one probe
+    lock = _HWACCEL_RUNTIME_LOCKS.setdefault(hwaccel, asyncio.Lock())
+    async with lock:
+        cached = _HWACCEL_RUNTIME_CACHE.get(hwaccel)
+        if cached is not None and time.monotonic() - cached[1] < _HWACCEL_CACHE_TTL:
+            return cached[0]
+
+        available = await _probe_hwaccel(hwaccel)
+        _HWACCEL_RUNTIME_CACHE[hwaccel] = (available, time.monotonic())
+        return available
+
+
+async def _probe_hwaccel(hwaccel: str) -> bool:
+    """Run a short FFmpeg encode with the given hwaccel and report success."""
     try:
         # Test command with testsrc (synthetic test video)
         # This checks if hwaccel works without needing a real input file
         test_cmd = [
             "ffmpeg",
-            "-hwaccel", hwaccel,
+            "-hwaccel", _HWACCEL_METHOD_NAMES.get(hwaccel, hwaccel),
             "-f", "lavfi",
             "-i", "testsrc=duration=1:size=640x480:rate=1",
             "-f", "null",
             "-"
         ]
 
+        # Only the exit code matters, so discard all output
         proc = await asyncio.create_subprocess_exec(
             *test_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
         )
 
-        stdout, stderr = await asyncio.wait_for(
-            proc.communicate(),
-            timeout=2  # Reduced from 5s to 2s for faster preview feedback
-        )
+        try:
+            await asyncio.wait_for(
+                proc.wait(),
+                timeout=2  # Reduced from 5s to 2s for faster preview feedback
+            )
+        except asyncio.TimeoutError:
+            await kill_process(proc)
+            raise
 
         if proc.returncode == 0:
             logger.info(f"Hardware acceleration '{hwaccel}' is available")
@@ -7,10 +7,12 @@ subtitle streams.
 """
 
 import asyncio
-import json
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
-from pathlib import Path
+from urllib.parse import urlsplit
+
+import orjson
 
 from models.stream_info import (
     InputAnalysisResult,
@@ -22,6 +24,77 @@ from models.stream_info import (
 
 logger = logging.getLogger(__name__)
 
+# Fields read by the _parse_* helpers; everything else ffprobe would emit
+# (side data, dispositions, full tag sets) is skipped at the source
+_ENTRIES = (
+    "format=format_name,format_long_name,duration,size,bit_rate"
+    ":stream=index,codec_type,codec_name,codec_long_name,profile,"
+    "width,height,r_frame_rate,avg_frame_rate,bit_rate,pix_fmt,"
+    "color_space,color_range,duration,nb_frames,"
+    "sample_rate,channels,channel_layout"
+    ":stream_tags=language,title"
+)
+
+_BASE_CMD = (
+    "-v", "quiet",  # Suppress log output
+    "-print_format", "json",  # Output as JSON
+    "-show_entries", _ENTRIES,  # Only the format/stream fields we parse
+)
+
+_UDP_OPTS = (
+    "-timeout", "3000000",  # 3 second timeout for UDP
+    "-analyzeduration", "2000000",  # Analyze only 2 seconds (fast)
+    "-probesize", "5000000",  # Probe size 5MB (reduced)
+)
+
+_HTTP_OPTS = (
+    "-timeout", "5000000",  # 5 second timeout for HTTP (reduced from 10s)
+    "-analyzeduration", "2000000",  # Analyze only 2 seconds (fast, reduced from 10s)
+    "-probesize", "10000000",  # Probe size 10MB (reduced from 20MB)
+)
+
+# URL schemes that get HTTP probe options
+_HTTP_SCHEMES = frozenset({"http", "https"})
+
+# ffprobe output larger than this is parsed off the event loop
+_THREADED_PARSE_THRESHOLD = 32 * 1024
+
+
+def _loads_ffprobe_json(stdout: bytes) -> Dict[str, Any]:
+    """
+    Parse ffprobe JSON output.
+
+    orjson accepts the raw bytes, no decode needed. Invalid UTF-8 in stream
+    tags is rejected by orjson, so retry on a lossy decode in that case.
+    """
+    try:
+        return orjson.loads(stdout)
+    except orjson.JSONDecodeError:
+        return orjson.loads(stdout.decode("utf-8", errors="ignore"))
+
+
+@lru_cache(maxsize=64)
+def _parse_frame_rate(rate_str: str) -> Optional[float]:
+    """
+    Parse frame rate string (e.g., "30/1", "30000/1001") to float.
+
+    Args:
+        rate_str: Frame rate as fraction string
+
+    Returns:
+        Frame rate as float, or None if parsing fails
+    """
+    try:
+        num, sep, den = rate_str.partition("/")
+        if not sep:
+            return float(num)
+        den_val = float(den)
+        if den_val == 0:
+            return None
+        return round(float(num) / den_val, 2)
+    except ValueError:
+        return None
+
 
 class FFprobeService:
     """Service for analyzing media inputs using ffprobe."""
@@ -89,6 +162,31 @@ class FFprobeService:
                 error=f"Analysis failed: {str(e)}"
             )
 
+    async def analyze_inputs(
+        self,
+        urls: List[str],
+        timeout: int = 10,
+        concurrency: int = 8
+    ) -> List[InputAnalysisResult]:
+        """
+        Analyze several media inputs concurrently.
+
+        Args:
+            urls: Input URLs/paths to analyze
+            timeout: Per-input analysis timeout in seconds
+            concurrency: Maximum number of ffprobe processes running at once
+
+        Returns:
+            List of InputAnalysisResult in the same order as urls
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _analyze(url: str) -> InputAnalysisResult:
+            async with semaphore:
+                return await self.analyze_input(url, timeout=timeout)
+
+        return list(await asyncio.gather(*(_analyze(url) for url in urls)))
+
     def _build_ffprobe_command(
         self,
         url: str,
@@ -104,34 +202,19 @@ class FFprobeService:
         Returns:
             List of command arguments
         """
-        command = [
-            self.ffprobe_path,
-            "-v", "quiet",  # Suppress log output
-            "-print_format", "json",  # Output as JSON
-            "-show_format",  # Show format/container info
-            "-show_streams",  # Show stream info
-        ]
+        scheme = urlsplit(url).scheme.lower()
 
         # Add protocol-specific options
         if input_type == "udp":
-            command.extend([
-                "-timeout", "3000000",  # 3 second timeout for UDP
-                "-analyzeduration", "2000000",  # Analyze only 2 seconds (fast)
-                "-probesize", "5000000"  # Probe size 5MB (reduced)
-            ])
-        elif input_type == "http" or url.startswith("http"):
-            command.extend([
-                "-timeout", "5000000",  # 5 second timeout for HTTP (reduced from 10s)
-                "-analyzeduration", "2000000",  # Analyze only 2 seconds (fast, reduced from 10s)
-                "-probesize", "10000000"  # Probe size 10MB (reduced from 20MB)
-            ])
-        elif input_type == "file" or Path(url).exists():
+            protocol_opts = _UDP_OPTS
+        elif input_type == "http" or scheme in _HTTP_SCHEMES:
+            protocol_opts = _HTTP_OPTS
+        else:
             # For files, use fast analysis without frame counting
             # Removed -count_frames to speed up analysis (User Story 7 optimization)
-            pass
+            protocol_opts = ()
 
-        command.append(url)
-        return command
+        return [self.ffprobe_path, *_BASE_CMD, *protocol_opts, url]
 
     async def _execute_ffprobe(
         self,
@@ -175,11 +258,13 @@ class FFprobeService:
             logger.error(f"FFprobe failed with code {process.returncode}: {error_msg}")
             raise RuntimeError(f"FFprobe failed: {error_msg}")
 
-        # Parse JSON output
-        output = stdout.decode("utf-8", errors="ignore")
+        # Parse JSON output; large documents are parsed in a worker thread
+        # so the event loop keeps serving other probes meanwhile
         try:
-            return json.loads(output)
-        except json.JSONDecodeError as e:
+            if len(stdout) > _THREADED_PARSE_THRESHOLD:
+                return await asyncio.to_thread(_loads_ffprobe_json, stdout)
+            return _loads_ffprobe_json(stdout)
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse ffprobe JSON output: {e}")
             raise RuntimeError(f"Invalid JSON output from ffprobe: {e}")
 
@@ -208,27 +293,32 @@ class FFprobeService:
         audio_streams = []
         subtitle_streams = []
 
-        # Track audio stream index separately (0-based audio-only index)
-        audio_index = 0
+        # codec_type -> (parser, destination list). The audio-only index
+        # (0:a:N) is the number of audio streams accepted so far.
+        dispatch = {
+            "video": (self._parse_video_stream, video_streams),
+            "audio": (
+                lambda s: self._parse_audio_stream(s, len(audio_streams)),
+                audio_streams
+            ),
+            "subtitle": (self._parse_subtitle_stream, subtitle_streams),
+        }
 
         for stream in streams:
             codec_type = stream.get("codec_type", "").lower()
+            entry = dispatch.get(codec_type)
+            if entry is None:
+                continue
 
-            if codec_type == "video":
-                video_stream = self._parse_video_stream(stream)
-                if video_stream:
-                    video_streams.append(video_stream)
-
-            elif codec_type == "audio":
-                audio_stream = self._parse_audio_stream(stream, audio_index)
-                if audio_stream:
-                    audio_streams.append(audio_stream)
-                    audio_index += 1
+            # A malformed stream is skipped without failing the whole analysis
+            try:
+                parsed = entry[0](stream)
+            except Exception as e:
+                logger.warning(f"Failed to parse {codec_type} stream: {e}")
+                continue
 
-            elif codec_type == "subtitle":
-                subtitle_stream = self._parse_subtitle_stream(stream)
-                if subtitle_stream:
-                    subtitle_streams.append(subtitle_stream)
+            if parsed:
+                entry[1].append(parsed)
 
         return InputAnalysisResult(
             url=url,
@@ -244,110 +334,79 @@ class FFprobeService:
 
     def _parse_video_stream(self, stream: Dict[str, Any]) -> Optional[VideoStreamInfo]:
         """Parse video stream information."""
-        try:
-            width = stream.get("width")
-            height = stream.get("height")
-
-            if not width or not height:
-                return None
-
-            # Calculate FPS from frame rate
-            fps = None
-            if "r_frame_rate" in stream:
-                fps = self._parse_frame_rate(stream["r_frame_rate"])
-            elif "avg_frame_rate" in stream:
-                fps = self._parse_frame_rate(stream["avg_frame_rate"])
-
-            return VideoStreamInfo(
-                index=stream.get("index", 0),
-                codec_name=stream.get("codec_name", "unknown"),
-                codec_long_name=stream.get("codec_long_name"),
-                profile=stream.get("profile"),
-                width=width,
-                height=height,
-                resolution=f"{width}x{height}",
-                fps=fps,
-                bit_rate=stream.get("bit_rate"),
-                pix_fmt=stream.get("pix_fmt"),
-                color_space=stream.get("color_space"),
-                color_range=stream.get("color_range"),
-                duration=self._parse_float(stream.get("duration")),
-                nb_frames=self._parse_int(stream.get("nb_frames"))
-            )
-        except Exception as e:
-            logger.warning(f"Failed to parse video stream: {e}")
+        get = stream.get
+        width = get("width")
+        height = get("height")
+
+        if not width or not height:
             return None
 
+        # Calculate FPS from frame rate
+        fps = None
+        if "r_frame_rate" in stream:
+            fps = _parse_frame_rate(stream["r_frame_rate"])
+        elif "avg_frame_rate" in stream:
+            fps = _parse_frame_rate(stream["avg_frame_rate"])
+
+        return VideoStreamInfo(
+            index=get("index", 0),
+            codec_name=get("codec_name", "unknown"),
+            codec_long_name=get("codec_long_name"),
+            profile=get("profile"),
+            width=width,
+            height=height,
+            resolution=f"{width}x{height}",
+            fps=fps,
+            bit_rate=get("bit_rate"),
+            pix_fmt=get("pix_fmt"),
+            color_space=get("color_space"),
+            color_range=get("color_range"),
+            duration=self._parse_float(get("duration")),
+            nb_frames=self._parse_int(get("nb_frames"))
+        )
+
     def _parse_audio_stream(self, stream: Dict[str, Any], audio_index: int) -> Optional[AudioStreamInfo]:
         """Parse audio stream information."""
-        try:
-            sample_rate = self._parse_int(stream.get("sample_rate"))
-            channels = stream.get("channels")
-
-            if not sample_rate or not channels:
-                return None
-
-            # Get language and title from tags
-            tags = stream.get("tags", {})
-            language = tags.get("language")
-            title = tags.get("title")
-
-            return AudioStreamInfo(
-                index=stream.get("index", 0),  # Global stream index (0, 1, 2...)
-                audio_index=audio_index,  # Audio-only index (0:a:0, 0:a:1...)
-                codec_name=stream.get("codec_name", "unknown"),
-                codec_long_name=stream.get("codec_long_name"),
-                sample_rate=sample_rate,
-                channels=channels,
-                channel_layout=stream.get("channel_layout"),
-                bit_rate=stream.get("bit_rate"),
-                duration=self._parse_float(stream.get("duration")),
-                language=language,
-                title=title
-            )
-        except Exception as e:
-            logger.warning(f"Failed to parse audio stream: {e}")
+        get = stream.get
+        sample_rate = self._parse_int(get("sample_rate"))
+        channels = get("channels")
+
+        if not sample_rate or not channels:
             return None
 
+        # Get language and title from tags
+        tags = get("tags", {})
+        language = tags.get("language")
+        title = tags.get("title")
+
+        return AudioStreamInfo(
+            index=get("index", 0),  # Global stream index (0, 1, 2...)
+            audio_index=audio_index,  # Audio-only index (0:a:0, 0:a:1...)
+            codec_name=get("codec_name", "unknown"),
+            codec_long_name=get("codec_long_name"),
+            sample_rate=sample_rate,
+            channels=channels,
+            channel_layout=get("channel_layout"),
+            bit_rate=get("bit_rate"),
+            duration=self._parse_float(get("duration")),
+            language=language,
+            title=title
+        )
+
     def _parse_subtitle_stream(
         self,
         stream: Dict[str, Any]
     ) -> Optional[SubtitleStreamInfo]:
         """Parse subtitle stream information."""
-        try:
-            return SubtitleStreamInfo(
-                index=stream.get("index", 0),
-                codec_name=stream.get("codec_name", "unknown"),
-                codec_long_name=stream.get("codec_long_name"),
-                language=stream.get("tags", {}).get("language"),
-                title=stream.get("tags", {}).get("title")
-            )
-        except Exception as e:
-            logger.warning(f"Failed to parse subtitle stream: {e}")
-            return None
-
-    @staticmethod
-    def _parse_frame_rate(rate_str: str) -> Optional[float]:
-        """
-        Parse frame rate string (e.g., "30/1", "30000/1001") to float.
-
-        Args:
-            rate_str: Frame rate as fraction string
-
-        Returns:
-            Frame rate as float, or None if parsing fails
-        """
-        try:
-            if "/" in rate_str:
-                num, den = rate_str.split("/")
-                num_val = float(num)
-                den_val = float(den)
-                if den_val == 0:
-                    return None
-                return round(num_val / den_val, 2)
-            return float(rate_str)
-        except (ValueError, ZeroDivisionError):
-            return None
+        get = stream.get
+        tags = get("tags", {})
+        return SubtitleStreamInfo(
+            index=get("index", 0),
+            codec_name=get("codec_name", "unknown"),
+            codec_long_name=get("codec_long_name"),
+            language=tags.get("language"),
+            title=tags.get("title")
+        )
 
     @staticmethod
     def _parse_float(value: Any) -> Optional[float]:
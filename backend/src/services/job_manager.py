@@ -3,22 +3,255 @@ Job Manager Service
 Handles encoding job lifecycle orchestration
 """
 
-import json
-from typing import List, Optional, Dict, Any
+import asyncio
+import re
+import shlex
+from collections import OrderedDict
+from contextlib import aclosing
+from functools import lru_cache
+from itertools import chain
+from pathlib import PurePosixPath
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from datetime import datetime
 import logging
 from uuid import uuid4
 
+import orjson
+from pydantic import TypeAdapter
+
 from models.job import EncodingJob, EncodingJobCreate, EncodingJobUpdate, JobStatus
 from models.input import InputSource, InputSourceCreate
 from models.output import OutputConfiguration, OutputConfigurationCreate
 from models.profile import EncodingProfile
+from models.encoding_settings import CreateJobRequest, HLSOutput, UDPOutput, StreamMap
+from models.rendition import RenditionCreate
 from services.storage import db_service
 from services.config_mapper import config_mapper
+from services.ffmpeg.command_builder import build_ffmpeg_command
+from services.validators.unified_config_validator import validator
 # OLD: from config.field_registry import get_output_table_fields, get_job_table_fields (DELETED - Phase 7)
 
 logger = logging.getLogger(__name__)
 
+# output_configurations columns loaded into OutputConfiguration, and the
+# subsets that are stored as JSON text / SQLite integers for booleans
+_OUTPUT_FIELDS = frozenset({
+    'output_type', 'output_url', 'hls_config', 'udp_config', 'file_config',
+    'segment_duration', 'playlist_size', 'playlist_type', 'segment_type', 'segment_pattern',
+    'video_codec', 'video_bitrate', 'video_resolution', 'video_framerate',
+    'audio_codec', 'audio_bitrate', 'audio_channels', 'audio_volume', 'audio_stream_index',
+    'encoding_preset', 'crf', 'keyframe_interval', 'tune', 'two_pass',
+    'rate_control_mode', 'profile', 'video_profile', 'level',
+    'max_bitrate', 'buffer_size', 'look_ahead', 'pixel_format',
+    'abr_enabled', 'renditions', 'stream_maps',
+})
+_JSON_OUTPUT_FIELDS = frozenset({'hls_config', 'udp_config', 'file_config', 'renditions', 'stream_maps'})
+_BOOL_OUTPUT_FIELDS = frozenset({'nginx_served', 'abr_enabled', 'two_pass'})
+
+# Output file extension -> unified outputFormat
+_EXT_MAP = {'mp4': 'mp4', 'mkv': 'mkv', 'webm': 'webm', 'avi': 'avi', 'mov': 'mov'}
+
+# INSERT statements used by create_job_unified
+_INSERT_JOB_SQL = """
+    INSERT INTO encoding_jobs (
+        id, name, status, command, full_config, created_at,
+        video_codec, audio_codec, video_bitrate, audio_bitrate,
+        hardware_accel, audio_volume, custom_args
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING *
+"""
+
+_INSERT_INPUT_SQL = """
+    INSERT INTO input_sources (
+        job_id, type, url, loop_enabled
+    ) VALUES (?, ?, ?, ?)
+"""
+
+_INSERT_OUTPUT_SQL = """
+    INSERT INTO output_configurations (
+        job_id, output_type, base_path, output_url,
+        video_codec, video_bitrate, video_resolution, video_framerate,
+        encoding_preset, video_profile, profile, level,
+        audio_codec, audio_bitrate, audio_channels, audio_volume,
+        segment_duration, playlist_type, playlist_size,
+        segment_type, segment_pattern,
+        abr_enabled, renditions
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Columns update_job_unified may write, per table (schema.sql minus keys and created_at)
+_JOB_UPDATE_COLUMNS = frozenset({
+    'name', 'profile_id', 'status', 'started_at', 'stopped_at', 'pid', 'error_message',
+    'command', 'priority', 'archive_on_complete',
+    'video_codec', 'audio_codec', 'video_bitrate', 'audio_bitrate', 'audio_volume',
+    'hardware_accel', 'template_id', 'custom_args', 'full_config',
+})
+_INPUT_UPDATE_COLUMNS = frozenset({'type', 'url', 'loop_enabled', 'hardware_accel'})
+_OUTPUT_UPDATE_COLUMNS = _OUTPUT_FIELDS | {'base_path', 'variant_paths', 'nginx_served', 'manifest_url'}
+
+# hardwareAccel -> decoder passed to -hwaccel by the single-bitrate builder
+_HWACCEL_DECODERS = {'nvenc': 'cuda', 'vaapi': 'vaapi', 'videotoolbox': 'videotoolbox'}
+
+# (unified config key, FFmpeg flag) emitted in order when the value is set
+_VIDEO_OPTION_FLAGS = (
+    ('videoBitrate', '-b:v'),
+    ('videoFrameRate', '-r'),
+    ('videoPreset', '-preset'),
+    ('videoProfile', '-profile:v'),
+)
+_AUDIO_OPTION_FLAGS = (
+    ('audioBitrate', '-b:a'),
+    ('audioChannels', '-ac'),
+)
+
+# RenditionCreate field <- ABR ladder entry key, with the default used when it is missing.
+# output_url lets each UDP ABR rendition have its own output URL.
+_RENDITION_FIELD_MAP = (
+    ('name', 'name', ''),
+    ('video_bitrate', 'videoBitrate', ''),
+    ('video_resolution', 'videoResolution', '1920x1080'),
+    ('audio_sample_rate', 'audioSampleRate', 48000),
+    ('max_bitrate', 'maxBitrate', None),
+    ('buffer_size', 'bufferSize', None),
+    ('output_url', 'outputUrl', None),
+)
+
+# Validates the whole ABR ladder in one call (schema built once at import)
+_RENDITION_LIST_ADAPTER = TypeAdapter(List[RenditionCreate])
+
+# File output suffixes that mark an outputDir as a full file path
+_VIDEO_EXTS = ('.mp4', '.webm', '.mkv', '.avi', '.mov')
+
+# udp://host:port[?ttl=N] as accepted for ABR UDP outputs
+_UDP_URL_RE = re.compile(r'udp://([^:]+):(\d+)(?:\?ttl=(\d+))?')
+
+# A job's row from each of the three tables, split on the marker columns
+_JOB_ROWS_SELECT = """
+    SELECT j.*, NULL AS _input_columns, i.*, NULL AS _output_columns, o.*
+    FROM encoding_jobs j
+    LEFT JOIN input_sources i ON i.job_id = j.id
+    LEFT JOIN output_configurations o ON o.job_id = j.id
+"""
+_JOB_ROWS_SQL = _JOB_ROWS_SELECT + "    WHERE j.id = ?\n"
+
+# Maximum number of generated commands kept by _command_for_unified_config
+_COMMAND_CACHE_MAX_SIZE = 256
+
+# Unified config keys read by _build_command_from_unified_config. The generated
+# command is cached per job against these values;
+# tests/test_job_manager.py fails if the builder reads a key missing here.
+_COMMAND_CONFIG_KEYS = (
+    'abrEnabled', 'abrLadder', 'audioBitrate', 'audioChannels', 'audioCodec',
+    'audioVolume', 'hardwareAccel', 'hlsPlaylistSize', 'hlsPlaylistType',
+    'hlsSegmentDuration', 'hlsSegmentFilename', 'hlsSegmentType', 'inputArgs',
+    'inputFile', 'inputFormat', 'loopInput', 'outputDir', 'outputFormat',
+    'outputUrl', 'rtmpOutputs', 'streamMaps', 'udpOutputs', 'videoBitrate',
+    'videoCodec', 'videoFilters', 'videoFrameRate', 'videoGOP', 'videoPreset',
+    'videoProfile', 'videoResolution',
+)
+
+# CreateJobRequest-style (snake_case) -> unified config (camelCase) field names
+_FIELD_MAPPING = (
+    ('job_name', 'jobName'),
+    ('input_file', 'inputFile'),
+    ('output_file', 'outputFile'),
+    ('loop_input', 'loopInput'),
+    ('video_resolution', 'videoResolution'),
+    ('video_framerate', 'videoFrameRate'),
+    ('encoding_preset', 'videoPreset'),
+    ('video_profile', 'videoProfile'),
+    ('video_level', 'videoLevel'),
+    ('hardware_accel', 'hardwareAccel'),
+    ('video_bitrate', 'videoBitrate'),
+    ('audio_bitrate', 'audioBitrate'),
+    ('audio_channels', 'audioChannels'),
+    ('audio_volume', 'audioVolume'),
+    ('custom_args', 'customFFmpegArgs'),
+    ('input_format', 'inputFormat'),
+    ('input_args', 'inputArgs'),
+)
+
+# FFmpeg encoder names -> simplified codec names used by the unified config
+_SIMPLIFIED_CODEC_MAP = {
+    'libx264': 'h264',
+    'libx265': 'h265',
+    'libvpx-vp9': 'vp9',
+    'libaom-av1': 'av1',
+    'h264_nvenc': 'h264',
+    'hevc_nvenc': 'h265',
+    'h265_nvenc': 'h265',
+}
+
+# Simplified codec names -> FFmpeg software encoders
+_CODEC_MAP = {'h264': 'libx264', 'h265': 'libx265', 'vp9': 'libvpx-vp9', 'av1': 'libaom-av1'}
+
+# hardwareAccel -> (codec name -> FFmpeg hardware encoder)
+_HW_CODEC_MAP = {
+    'nvenc': {
+        'h264': 'h264_nvenc', 'libx264': 'h264_nvenc',
+        'h265': 'hevc_nvenc', 'hevc': 'hevc_nvenc', 'libx265': 'hevc_nvenc',
+        'av1': 'av1_nvenc', 'libaom-av1': 'av1_nvenc',
+    },
+    'vaapi': {
+        'h264': 'h264_vaapi', 'libx264': 'h264_vaapi',
+        'h265': 'hevc_vaapi', 'hevc': 'hevc_vaapi', 'libx265': 'hevc_vaapi',
+        'av1': 'av1_vaapi', 'libaom-av1': 'av1_vaapi',
+    },
+    'videotoolbox': {
+        'h264': 'h264_videotoolbox', 'libx264': 'h264_videotoolbox',
+        'h265': 'hevc_videotoolbox', 'hevc': 'hevc_videotoolbox', 'libx265': 'hevc_videotoolbox',
+        # Note: AV1 is not supported by VideoToolbox
+    },
+}
+
+
+def _json_default(obj: Any) -> str:
+    """orjson fallback for values it can't serialize natively"""
+    return obj.isoformat() if hasattr(obj, 'isoformat') else str(obj)
+
+
+def _path_contains_id(path: str, job_id: str) -> bool:
+    """Check whether job_id is one of the components of an output path"""
+    return job_id in PurePosixPath(path).parts
+
+
+def _filter_columns(fields: Dict[str, Any], columns: frozenset, table: str) -> Dict[str, Any]:
+    """Drop keys that are not updatable columns of table (SQL only ever names known columns)"""
+    unknown = fields.keys() - columns
+    if not unknown:
+        return fields
+    logger.warning(f"Ignoring non-updatable {table} fields: {sorted(unknown)}")
+    return {k: v for k, v in fields.items() if k in columns}
+
+
+def _changed_fields(fields: Dict[str, Any], current: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the fields whose value differs from the stored row (all of them if there is no row)"""
+    if current is None:
+        return fields
+    return {k: v for k, v in fields.items() if k not in current or current[k] != v}
+
+
+@lru_cache(maxsize=64)
+def _video_encoder_args(hw_accel: Optional[str], video_codec: str) -> Tuple[str, ...]:
+    """Resolve the -c:v arguments for a hardwareAccel/videoCodec pair (cached per pair)"""
+    if hw_accel in _HW_CODEC_MAP:
+        actual_codec = _HW_CODEC_MAP[hw_accel].get(video_codec, f'{video_codec}_{hw_accel}')
+    else:
+        # Software codec: Map simplified codec to FFmpeg lib name
+        actual_codec = _CODEC_MAP.get(video_codec, 'libx264')
+
+    # Add video codec tag for HEVC compatibility (hvc1 works better than hev1 on Apple devices)
+    if 'hevc' in actual_codec.lower() or 'h265' in video_codec.lower() or '265' in video_codec.lower():
+        return ('-c:v', actual_codec, '-tag:v', 'hvc1')
+    return ('-c:v', actual_codec)
+
+
+@lru_cache(maxsize=256)
+def _build_update_sql(table: str, columns: Tuple[str, ...], where_col: str) -> str:
+    """Build an UPDATE statement for a column set (cached, edits repeat shapes)"""
+    set_clause = ', '.join(f"{col} = ?" for col in columns)
+    return f"UPDATE {table} SET {set_clause} WHERE {where_col} = ?"
+
 
 class JobManager:
     """Manages encoding job lifecycle"""
@@ -27,6 +260,8 @@ class JobManager:
         """Initialize job manager"""
         self.db = db_service
         self.active_jobs: Dict[str, EncodingJob] = {}
+        # job_id -> (command key, generated command), most recently used last
+        self._command_cache: "OrderedDict[str, Tuple[bytes, str]]" = OrderedDict()
 
     async def get_job(self, job_id: str) -> Optional[EncodingJob]:
         """Get a job by ID
@@ -82,6 +317,33 @@ class JobManager:
         Returns:
             List[EncodingJob]: List of jobs
         """
+        async with aclosing(self.iter_jobs(status=status, limit=limit, offset=offset)) as jobs:
+            return [job async for job in jobs]
+
+    async def iter_jobs(
+        self,
+        status: Optional[JobStatus] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> AsyncIterator[EncodingJob]:
+        """Iterate encoding jobs, streaming rows from the database cursor
+
+        Unlike fetching all rows up front, only one row at a time is
+        materialized alongside the jobs the caller keeps.
+
+        The generator holds a pooled database connection until it is
+        exhausted or closed. Callers must wrap it in contextlib.aclosing()
+        so that breaking out early or being cancelled returns the connection
+        right away instead of whenever the generator is garbage-collected.
+
+        Args:
+            status: Filter by status (optional)
+            limit: Maximum number of results
+            offset: Skip this many results
+
+        Yields:
+            EncodingJob: Jobs in list_jobs() order
+        """
         query = """
             SELECT * FROM encoding_jobs
             WHERE 1=1
@@ -95,8 +357,10 @@ class JobManager:
         query += " ORDER BY priority DESC, created_at DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        rows = await self.db.fetch_all(query, tuple(params))
-        return [self._row_to_job(row) for row in rows]
+        async with self.db.get_connection() as conn:
+            async with conn.execute(query, tuple(params)) as cursor:
+                async for row in cursor:
+                    yield self._row_to_job(dict(row))
 
     async def delete_job(self, job_id: str) -> bool:
         """Delete a job
@@ -124,6 +388,7 @@ class JobManager:
             "DELETE FROM encoding_jobs WHERE id = ?",
             (job_id,)
         )
+        self._command_cache.pop(job_id, None)
 
         logger.info(f"Deleted job {job_id}")
         return True
@@ -143,37 +408,37 @@ class JobManager:
         Raises:
             ValueError: If job is running or already pending
         """
-        from models.job import JobStatus
+        # Reset the job in one statement; the state check is part of the
+        # WHERE clause and the updated row comes back via RETURNING
+        async with self.db.get_connection() as conn:
+            async with conn.execute(
+                """
+                UPDATE encoding_jobs
+                SET status = ?,
+                    error_message = NULL,
+                    stopped_at = NULL,
+                    pid = NULL
+                WHERE id = ? AND status NOT IN (?, ?)
+                RETURNING *
+                """,
+                (JobStatus.PENDING, job_id, JobStatus.RUNNING, JobStatus.PENDING)
+            ) as cursor:
+                row = await cursor.fetchone()
+            await conn.commit()
 
-        # Get job
+        if row:
+            logger.info(f"Reset job {job_id} to PENDING")
+            return self._row_to_job(dict(row))
+
+        # Nothing updated: find out whether the job is missing or not resettable
         job = await self.get_job(job_id)
         if not job:
             return None
 
-        # Validate job can be reset
         if job.status == JobStatus.RUNNING:
             raise ValueError(f"Cannot reset status of running job {job_id}")
 
-        if job.status == JobStatus.PENDING:
-            raise ValueError(f"Job {job_id} is already in PENDING status")
-
-        # Reset the job
-        await self.db.execute(
-            """
-            UPDATE encoding_jobs
-            SET status = ?,
-                error_message = NULL,
-                stopped_at = NULL,
-                pid = NULL
-            WHERE id = ?
-            """,
-            (JobStatus.PENDING, job_id)
-        )
-
-        logger.info(f"Reset job {job_id} from {job.status} to PENDING")
-
-        # Return updated job
-        return await self.get_job(job_id)
+        raise ValueError(f"Job {job_id} is already in PENDING status")
 
     async def get_job_with_config(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get job with full configuration including input and output
@@ -184,32 +449,172 @@ class JobManager:
         Returns:
             Optional[Dict]: Job with input/output config if found
         """
-        # Get job
-        job = await self.get_job(job_id)
-        if not job:
+        async with self.db.get_connection() as conn:
+            rows = await self._fetch_job_rows(conn, job_id)
+        if rows is None:
             return None
 
-        # Get input source
-        input_row = await self.db.fetch_one(
-            "SELECT * FROM input_sources WHERE job_id = ?",
-            (job_id,)
-        )
+        job_row, input_row, output_row = rows
+        return self._assemble_job_config(self._row_to_job(job_row), input_row, output_row)
 
-        # Get output config
-        output_row = await self.db.fetch_one(
-            "SELECT * FROM output_configurations WHERE job_id = ?",
-            (job_id,)
+    @staticmethod
+    async def _fetch_job_rows(
+        conn, job_id: str
+    ) -> Optional[Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """Fetch a job's encoding_jobs, input_sources and output_configurations rows
+
+        Returns:
+            (job_row, input_row, output_row), with None for a missing input or
+            output row, or None if the job doesn't exist
+        """
+        # Fetch job, input source and output config in one statement. The
+        # marker columns split the row back into the three tables' columns
+        # without having to list (and keep in sync) every column here.
+        async with conn.execute(_JOB_ROWS_SQL, (job_id,)) as cursor:
+            row = await cursor.fetchone()
+            if not row:
+                return None
+            columns = [description[0] for description in cursor.description]
+
+        return JobManager._split_job_rows(columns, row)
+
+    @staticmethod
+    def _split_job_rows(
+        columns: List[str], row
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Split a _JOB_ROWS_SELECT row into its job, input and output rows"""
+        input_start = columns.index("_input_columns")
+        output_start = columns.index("_output_columns")
+
+        job_row = dict(zip(columns[:input_start], row[:input_start]))
+        input_row = dict(zip(
+            columns[input_start + 1:output_start],
+            row[input_start + 1:output_start]
+        ))
+        output_row = dict(zip(columns[output_start + 1:], row[output_start + 1:]))
+
+        # LEFT JOIN misses come back as all-NULL columns
+        if input_row.get("job_id") is None:
+            input_row = None
+        if output_row.get("job_id") is None:
+            output_row = None
+
+        return job_row, input_row, output_row
+
+    async def list_jobs_with_config(
+        self,
+        status: Optional[JobStatus] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """List encoding jobs with their input and output configuration
+
+        Same result per job as get_job_with_config(), but the input and
+        output rows for the whole page are fetched with one query each
+        instead of two queries per job.
+
+        Args:
+            status: Filter by status (optional)
+            limit: Maximum number of results
+            offset: Skip this many results
+
+        Returns:
+            List[Dict]: Jobs with input/output config
+        """
+        jobs = await self.list_jobs(status=status, limit=limit, offset=offset)
+        if not jobs:
+            return []
+
+        job_ids = tuple(job.id for job in jobs)
+        placeholders = ",".join("?" * len(job_ids))
+
+        input_rows = await self.db.fetch_all(
+            f"SELECT * FROM input_sources WHERE job_id IN ({placeholders})",
+            job_ids
+        )
+        output_rows = await self.db.fetch_all(
+            f"SELECT * FROM output_configurations WHERE job_id IN ({placeholders})",
+            job_ids
         )
 
+        # Keep the first row per job, matching fetch_one() in get_job_with_config
+        inputs_by_job: Dict[str, dict] = {}
+        for row in input_rows:
+            inputs_by_job.setdefault(row["job_id"], row)
+        outputs_by_job: Dict[str, dict] = {}
+        for row in output_rows:
+            outputs_by_job.setdefault(row["job_id"], row)
+
+        return [
+            self._assemble_job_config(job, inputs_by_job.get(job.id), outputs_by_job.get(job.id))
+            for job in jobs
+        ]
+
+    async def get_jobs_with_configs(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several jobs with their input and output configuration
+
+        Same result per job as get_job_with_config(), fetched with a single
+        query for all IDs.
+
+        Args:
+            job_ids: Job IDs
+
+        Returns:
+            Dict[str, Dict]: Job with input/output config by job ID (jobs
+            that don't exist are left out)
+        """
+        if not job_ids:
+            return {}
+
+        placeholders = ",".join("?" * len(job_ids))
+        async with self.db.get_connection() as conn:
+            async with conn.execute(
+                f"{_JOB_ROWS_SELECT}    WHERE j.id IN ({placeholders})\n",
+                tuple(job_ids)
+            ) as cursor:
+                rows = await cursor.fetchall()
+                columns = [description[0] for description in cursor.description]
+
+        configs: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            job_row, input_row, output_row = self._split_job_rows(columns, row)
+            # Keep the first row per job, matching fetchone() in get_job_with_config
+            if job_row["id"] not in configs:
+                configs[job_row["id"]] = self._assemble_job_config(
+                    self._row_to_job(job_row), input_row, output_row
+                )
+        return configs
+
+    def _assemble_job_config(
+        self,
+        job: EncodingJob,
+        input_row: Optional[dict],
+        output_row: Optional[dict]
+    ) -> Dict[str, Any]:
+        """Build the job/input/output config dict from already-fetched rows
+
+        Args:
+            job: Job instance
+            input_row: input_sources row for the job (optional)
+            output_row: output_configurations row for the job (optional)
+
+        Returns:
+            Dict: Job with input/output config
+        """
+        job_id = job.id
+
+        job_dict = job.dict()
         result = {
-            "job": job.dict(),
+            "job": job_dict,
             "input": None,
             "output": None
         }
 
-        # Debug logging
-        logger.info(f"[DEBUG] Job {job_id} - job.dict() keys: {list(job.dict().keys())}")
-        logger.info(f"[DEBUG] Job {job_id} - job.video_bitrate={job.video_bitrate}, job.hardware_accel={job.hardware_accel}")
+        # Debug logging (guarded so the messages aren't built at INFO level)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"Job {job_id} - job.dict() keys: {list(job_dict)}")
+            logger.debug(f"Job {job_id} - job.video_bitrate={job.video_bitrate}, job.hardware_accel={job.hardware_accel}")
 
         if input_row:
             # Validate loop_enabled - it's only valid for file inputs
@@ -223,7 +628,7 @@ class JobManager:
                 type=input_row["type"],
                 url=input_row["url"],
                 loop_enabled=loop_enabled,
-                hardware_accel=json.loads(input_row["hardware_accel"]) if input_row["hardware_accel"] else None
+                hardware_accel=orjson.loads(input_row["hardware_accel"]) if input_row["hardware_accel"] else None
             )
             result["input"] = input_source.dict()
 
@@ -232,7 +637,7 @@ class JobManager:
             output_data = {
                 "job_id": output_row["job_id"],
                 "base_path": output_row["base_path"],
-                "variant_paths": json.loads(output_row["variant_paths"]),
+                "variant_paths": orjson.loads(output_row["variant_paths"]),
                 "nginx_served": output_row["nginx_served"],
                 "manifest_url": output_row["manifest_url"]
             }
@@ -244,44 +649,34 @@ class JobManager:
                 output_data["output_url"] = output_row.get("output_url")
 
             # Load all output configuration fields (simplified - Phase 7)
-            # Hardcoded field list replaces field_registry automatic extraction
-            output_fields = [
-                'output_type', 'output_url', 'hls_config', 'udp_config', 'file_config',
-                'segment_duration', 'playlist_size', 'playlist_type', 'segment_type', 'segment_pattern',
-                'video_codec', 'video_bitrate', 'video_resolution', 'video_framerate',
-                'audio_codec', 'audio_bitrate', 'audio_channels', 'audio_volume', 'audio_stream_index',
-                'encoding_preset', 'crf', 'keyframe_interval', 'tune', 'two_pass',
-                'rate_control_mode', 'profile', 'video_profile', 'level',
-                'max_bitrate', 'buffer_size', 'look_ahead', 'pixel_format',
-                'abr_enabled', 'renditions', 'stream_maps'
-            ]
-
-            for field_name in output_fields:
-                if field_name in output_row.keys():
-                    value = output_row.get(field_name)
-
-                    # Handle JSON fields
-                    if field_name in ['hls_config', 'udp_config', 'file_config', 'renditions', 'stream_maps'] and value:
-                        try:
-                            output_data[field_name] = json.loads(value) if isinstance(value, str) else value
-                        except (json.JSONDecodeError, TypeError):
-                            logger.warning(f"Failed to parse JSON field {field_name}")
-                            output_data[field_name] = value
-                    # Handle boolean fields
-                    elif field_name in ['nginx_served', 'abr_enabled', 'two_pass'] and value is not None:
-                        output_data[field_name] = bool(value)
-                    # All other fields
-                    elif value is not None:
+            # Hardcoded field sets replace field_registry automatic extraction
+            for field_name in _OUTPUT_FIELDS.intersection(output_row.keys()):
+                value = output_row[field_name]
+
+                # Handle JSON fields
+                if field_name in _JSON_OUTPUT_FIELDS and value:
+                    try:
+                        output_data[field_name] = orjson.loads(value) if isinstance(value, str) else value
+                    except (orjson.JSONDecodeError, TypeError):
+                        logger.warning(f"Failed to parse JSON field {field_name}")
                         output_data[field_name] = value
+                # Handle boolean fields
+                elif field_name in _BOOL_OUTPUT_FIELDS and value is not None:
+                    output_data[field_name] = bool(value)
+                # All other fields
+                elif value is not None:
+                    output_data[field_name] = value
 
-            logger.info(f"Loaded {len(output_data)} output fields for job {job_id}")
+            if debug_enabled:
+                logger.debug(f"Loaded {len(output_data)} output fields for job {job_id}")
 
             output_config = OutputConfiguration(**output_data)
             result["output"] = output_config.dict()
 
             # Debug logging for ABR and encoding params
-            logger.info(f"Loaded job {job_id} - ABR enabled: {output_config.abr_enabled}, renditions: {len(output_config.renditions)}")
-            logger.info(f"[DEBUG] Job {job_id} - output.video_bitrate={output_config.video_bitrate}, output.video_framerate={output_config.video_framerate}")
+            if debug_enabled:
+                logger.debug(f"Loaded job {job_id} - ABR enabled: {output_config.abr_enabled}, renditions: {len(output_config.renditions)}")
+                logger.debug(f"Job {job_id} - output.video_bitrate={output_config.video_bitrate}, output.video_framerate={output_config.video_framerate}")
 
         return result
 
@@ -312,28 +707,34 @@ class JobManager:
         Returns:
             EncodingJob: Job instance
         """
+        get = row.get
+        fromisoformat = datetime.fromisoformat
+        created_at = row["created_at"]
+        started_at = row["started_at"]
+        stopped_at = row["stopped_at"]
+
         job = EncodingJob(
             id=row["id"],
             name=row["name"],
             profile_id=row["profile_id"],
             status=row["status"],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
-            started_at=datetime.fromisoformat(row["started_at"]) if row["started_at"] else None,
-            stopped_at=datetime.fromisoformat(row["stopped_at"]) if row["stopped_at"] else None,
+            created_at=fromisoformat(created_at) if created_at else None,
+            started_at=fromisoformat(started_at) if started_at else None,
+            stopped_at=fromisoformat(stopped_at) if stopped_at else None,
             pid=row["pid"],
             error_message=row["error_message"],
             command=row["command"],
             priority=row["priority"],
-            archive_on_complete=bool(row.get("archive_on_complete", False)),
+            archive_on_complete=bool(get("archive_on_complete", False)),
             # Encoding parameters from job table
-            video_codec=row.get("video_codec"),
-            audio_codec=row.get("audio_codec"),
-            video_bitrate=row.get("video_bitrate"),
-            audio_bitrate=row.get("audio_bitrate"),
-            audio_volume=row.get("audio_volume"),  # FIXED: Was missing!
-            hardware_accel=row.get("hardware_accel"),
-            template_id=row.get("template_id"),
-            custom_args=row.get("custom_args")
+            video_codec=get("video_codec"),
+            audio_codec=get("audio_codec"),
+            video_bitrate=get("video_bitrate"),
+            audio_bitrate=get("audio_bitrate"),
+            audio_volume=get("audio_volume"),  # FIXED: Was missing!
+            hardware_accel=get("hardware_accel"),
+            template_id=get("template_id"),
+            custom_args=get("custom_args")
         )
 
         return job
@@ -368,8 +769,7 @@ class JobManager:
         else:
             # CREATE: Use create_job_unified()
             unified_config = self._convert_to_unified_format(job_data)
-            new_job_id = await self.create_job_unified(unified_config)
-            return await self.get_job(new_job_id)
+            return await self._create_job_unified(unified_config)
 
     def _convert_to_unified_format(self, job_data: dict) -> dict:
         """
@@ -380,50 +780,16 @@ class JobManager:
         """
         unified = {}
 
-        # Codec simplification helper
-        def simplify_codec(codec):
-            """Convert FFmpeg codec names to simplified format"""
-            if not codec:
-                return codec
-            codec_map = {
-                'libx264': 'h264',
-                'libx265': 'h265',
-                'libvpx-vp9': 'vp9',
-                'libaom-av1': 'av1',
-                'h264_nvenc': 'h264',
-                'hevc_nvenc': 'h265',
-                'h265_nvenc': 'h265'
-            }
-            return codec_map.get(codec, codec)
-
         # Map snake_case to camelCase
-        field_mapping = {
-            'job_name': 'jobName',
-            'input_file': 'inputFile',
-            'output_file': 'outputFile',
-            'loop_input': 'loopInput',
-            'video_resolution': 'videoResolution',
-            'video_framerate': 'videoFrameRate',
-            'encoding_preset': 'videoPreset',
-            'video_profile': 'videoProfile',
-            'video_level': 'videoLevel',
-            'hardware_accel': 'hardwareAccel',
-            'video_bitrate': 'videoBitrate',
-            'audio_bitrate': 'audioBitrate',
-            'audio_channels': 'audioChannels',
-            'audio_volume': 'audioVolume',
-            'custom_args': 'customFFmpegArgs',
-            'input_format': 'inputFormat',
-            'input_args': 'inputArgs',
-        }
-
-        for old_key, new_key in field_mapping.items():
-            if old_key in job_data and job_data[old_key] is not None:
-                unified[new_key] = job_data[old_key]
+        get = job_data.get
+        for old_key, new_key in _FIELD_MAPPING:
+            value = get(old_key)
+            if value is not None:
+                unified[new_key] = value
 
         # Handle codec conversion
         if 'video_codec' in job_data:
-            unified['videoCodec'] = simplify_codec(job_data['video_codec'])
+            unified['videoCodec'] = _SIMPLIFIED_CODEC_MAP.get(job_data['video_codec'], job_data['video_codec'])
             logger.info(f"[codec_convert] video_codec '{job_data['video_codec']}' → videoCodec '{unified['videoCodec']}'")
         if 'audio_codec' in job_data:
             unified['audioCodec'] = job_data['audio_codec']
@@ -490,18 +856,8 @@ class JobManager:
             if 'output_file' in job_data and job_data['output_file']:
                 # File output - detect format from file extension
                 file_path = job_data['output_file']
-                if file_path.endswith('.mp4'):
-                    unified['outputFormat'] = 'mp4'
-                elif file_path.endswith('.mkv'):
-                    unified['outputFormat'] = 'mkv'
-                elif file_path.endswith('.webm'):
-                    unified['outputFormat'] = 'webm'
-                elif file_path.endswith('.avi'):
-                    unified['outputFormat'] = 'avi'
-                elif file_path.endswith('.mov'):
-                    unified['outputFormat'] = 'mov'
-                else:
-                    unified['outputFormat'] = 'mp4'  # Default to mp4 for file outputs
+                # Default to mp4 for file outputs with an unknown extension
+                unified['outputFormat'] = _EXT_MAP.get(file_path.rpartition('.')[2], 'mp4')
                 unified['outputDir'] = file_path.rsplit('/', 1)[0]  # Extract directory
                 unified['outputUrl'] = file_path  # Store full file path
             else:
@@ -531,6 +887,8 @@ class JobManager:
         1. Try to load from full_config cache (fast path)
         2. If cache miss, build from normalized tables and cache it
 
+        Every call returns a freshly parsed dict, so callers may modify it.
+
         Args:
             job_id: Job identifier
 
@@ -548,7 +906,7 @@ class JobManager:
         if row and row['full_config']:
             # Cache hit - return JSON directly
             logger.debug(f"Cache hit for job {job_id}")
-            return json.loads(row['full_config'])
+            return orjson.loads(row['full_config'])
 
         # Cache miss - build from normalized tables
         logger.debug(f"Cache miss for job {job_id}, building from tables")
@@ -558,7 +916,6 @@ class JobManager:
             return None
 
         # Convert to unified format using config_mapper
-        from services.config_mapper import config_mapper
         unified = config_mapper.to_unified_format(job_data)
 
         # Update cache for next time
@@ -591,9 +948,16 @@ class JobManager:
 
         Feature: 001-edit-api-simplification (Phase 7)
         """
-        from uuid import uuid4
-        from datetime import datetime
+        job = await self._create_job_unified(config)
+        return job.id
+
+    async def _create_job_unified(self, config: Dict[str, Any]) -> EncodingJob:
+        """
+        Create a job from a unified config and return the stored job.
 
+        The encoding_jobs INSERT uses RETURNING, so the returned job carries
+        the column defaults without a follow-up SELECT.
+        """
         # Generate job ID
         job_id = str(uuid4())
         config['id'] = job_id
@@ -604,7 +968,6 @@ class JobManager:
         config.setdefault('updatedAt', datetime.utcnow().isoformat())
 
         # Validate configuration
-        from services.validators.unified_config_validator import validator
         errors = validator.validate(config)
 
         if errors:
@@ -612,7 +975,7 @@ class JobManager:
             raise ValueError(f"Validation failed: {', '.join(error_messages)}")
 
         # Generate FFmpeg command
-        command = self._build_command_from_unified_config(config, job_id)
+        command = self._command_for_unified_config(config, job_id)
         config['ffmpegCommand'] = command
 
         # Convert unified to legacy format for table inserts
@@ -626,17 +989,18 @@ class JobManager:
         output_format = config.get('outputFormat', 'hls')
         if output_format == 'hls':
             base_output_dir = config.get('outputDir', '/output/hls')
-            if job_id not in base_output_dir:
+            if not _path_contains_id(base_output_dir, job_id):
                 output_fields['base_path'] = f'{base_output_dir.rstrip("/")}/{job_id}'
             else:
                 output_fields['base_path'] = base_output_dir
         elif output_format in ['mp4', 'webm', 'mkv', 'avi', 'mov']:
             # File output - ensure job_id in path
             base_output_path = config.get('outputDir', f'/output/files/{job_id}/output.{output_format}')
-            if job_id not in base_output_path:
-                if base_output_path.endswith(('.mp4', '.webm', '.mkv', '.avi', '.mov')):
-                    dir_part = base_output_path.rsplit('/', 1)[0] if '/' in base_output_path else '/output/files'
-                    file_part = base_output_path.rsplit('/', 1)[1] if '/' in base_output_path else base_output_path
+            if not _path_contains_id(base_output_path, job_id):
+                if base_output_path.endswith(_VIDEO_EXTS):
+                    head, sep, tail = base_output_path.rpartition('/')
+                    dir_part = head if sep else '/output/files'
+                    file_part = tail if sep else base_output_path
                     output_fields['base_path'] = f'{dir_part}/{job_id}/{file_part}'
                 else:
                     output_fields['base_path'] = f'{base_output_path.rstrip("/")}/{job_id}'
@@ -645,89 +1009,79 @@ class JobManager:
 
         # Prepare INSERT values
         async with self.db.get_connection() as conn:
-            await conn.execute("BEGIN")
-
             try:
-                # Insert into encoding_jobs table
-                await conn.execute(
-                    """
-                    INSERT INTO encoding_jobs (
-                        id, name, status, command, full_config, created_at,
-                        video_codec, audio_codec, video_bitrate, audio_bitrate,
-                        hardware_accel, audio_volume, custom_args
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        job_id,
-                        job_fields.get('name'),
-                        job_fields.get('status', 'pending'),
-                        command,
-                        json.dumps(config, default=lambda o: o.isoformat() if hasattr(o, 'isoformat') else str(o)),
-                        config.get('createdAt'),
-                        job_fields.get('video_codec'),
-                        job_fields.get('audio_codec'),
-                        job_fields.get('video_bitrate'),
-                        job_fields.get('audio_bitrate'),
-                        job_fields.get('hardware_accel'),
-                        job_fields.get('audio_volume'),
-                        job_fields.get('custom_args')
-                    )
-                )
-
-                # Insert into input_sources table
-                await conn.execute(
-                    """
-                    INSERT INTO input_sources (
-                        job_id, type, url, loop_enabled
-                    ) VALUES (?, ?, ?, ?)
-                    """,
-                    (
-                        job_id,
-                        input_fields.get('type', 'file'),
-                        input_fields.get('url'),
-                        input_fields.get('loop_enabled', False)
-                    )
-                )
-
-                # Insert into output_configurations table
-                await conn.execute(
-                    """
-                    INSERT INTO output_configurations (
-                        job_id, output_type, base_path, output_url,
-                        video_codec, video_bitrate, video_resolution, video_framerate,
-                        encoding_preset, video_profile, profile, level,
-                        audio_codec, audio_bitrate, audio_channels, audio_volume,
-                        segment_duration, playlist_type, playlist_size,
-                        segment_type, segment_pattern,
-                        abr_enabled, renditions
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        job_id,
-                        output_fields.get('output_type', 'hls'),
-                        output_fields.get('base_path'),
-                        output_fields.get('output_url'),
-                        output_fields.get('video_codec'),
-                        output_fields.get('video_bitrate'),
-                        output_fields.get('video_resolution'),
-                        output_fields.get('video_framerate'),
-                        output_fields.get('encoding_preset'),
-                        output_fields.get('video_profile'),
-                        output_fields.get('profile'),
-                        output_fields.get('level'),
-                        output_fields.get('audio_codec'),
-                        output_fields.get('audio_bitrate'),
-                        output_fields.get('audio_channels'),
-                        output_fields.get('audio_volume'),
-                        output_fields.get('segment_duration', 6),
-                        output_fields.get('playlist_type', 'vod'),
-                        output_fields.get('playlist_size', 5),
-                        output_fields.get('segment_type', 'mpegts'),
-                        output_fields.get('segment_pattern', 'segment_%03d.ts'),
-                        output_fields.get('abr_enabled', False),
-                        output_fields.get('renditions')
-                    )
+                # The three INSERTs are queued on the connection's worker
+                # thread together and run there in order, instead of waiting
+                # for each one before sending the next. sqlite3 opens the
+                # transaction implicitly before the first INSERT.
+                results = await asyncio.gather(
+                    # Insert into encoding_jobs table
+                    conn.execute(
+                        _INSERT_JOB_SQL,
+                        (
+                            job_id,
+                            job_fields.get('name'),
+                            job_fields.get('status', 'pending'),
+                            command,
+                            orjson.dumps(config, default=_json_default).decode(),
+                            config.get('createdAt'),
+                            job_fields.get('video_codec'),
+                            job_fields.get('audio_codec'),
+                            job_fields.get('video_bitrate'),
+                            job_fields.get('audio_bitrate'),
+                            job_fields.get('hardware_accel'),
+                            job_fields.get('audio_volume'),
+                            job_fields.get('custom_args')
+                        )
+                    ),
+
+                    # Insert into input_sources table
+                    conn.execute(
+                        _INSERT_INPUT_SQL,
+                        (
+                            job_id,
+                            input_fields.get('type', 'file'),
+                            input_fields.get('url'),
+                            input_fields.get('loop_enabled', False)
+                        )
+                    ),
+
+                    # Insert into output_configurations table
+                    conn.execute(
+                        _INSERT_OUTPUT_SQL,
+                        (
+                            job_id,
+                            output_fields.get('output_type', 'hls'),
+                            output_fields.get('base_path'),
+                            output_fields.get('output_url'),
+                            output_fields.get('video_codec'),
+                            output_fields.get('video_bitrate'),
+                            output_fields.get('video_resolution'),
+                            output_fields.get('video_framerate'),
+                            output_fields.get('encoding_preset'),
+                            output_fields.get('video_profile'),
+                            output_fields.get('profile'),
+                            output_fields.get('level'),
+                            output_fields.get('audio_codec'),
+                            output_fields.get('audio_bitrate'),
+                            output_fields.get('audio_channels'),
+                            output_fields.get('audio_volume'),
+                            output_fields.get('segment_duration', 6),
+                            output_fields.get('playlist_type', 'vod'),
+                            output_fields.get('playlist_size', 5),
+                            output_fields.get('segment_type', 'mpegts'),
+                            output_fields.get('segment_pattern', 'segment_%03d.ts'),
+                            output_fields.get('abr_enabled', False),
+                            output_fields.get('renditions')
+                        )
+                    ),
+                    return_exceptions=True
                 )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+                # Step the RETURNING cursor before committing
+                job_row = await results[0].fetchone()
 
                 await conn.commit()
                 logger.info(f"Created job {job_id} using unified API")
@@ -737,7 +1091,7 @@ class JobManager:
                 logger.error(f"Failed to create job {job_id}: {e}", exc_info=True)
                 raise
 
-        return job_id
+        return self._row_to_job(dict(job_row))
 
     async def update_job_unified(self, job_id: str, config: Dict[str, Any]) -> None:
         """
@@ -756,7 +1110,6 @@ class JobManager:
         Feature: 001-edit-api-simplification
         """
         # Validate configuration
-        from services.validators.unified_config_validator import validator
         errors = validator.validate(config)
 
         if errors:
@@ -766,23 +1119,23 @@ class JobManager:
             )
 
         # Convert unified format to legacy format for database update
-        from services.config_mapper import config_mapper
         legacy_format = config_mapper.to_legacy_format(config)
 
         # Feature 008: Fix base_path to include job_id (matching FFmpeg command)
         output_format = config.get('outputFormat', 'hls')
         if output_format == 'hls':
             base_output_dir = config.get('outputDir', '/output/hls')
-            if job_id not in base_output_dir:
+            if not _path_contains_id(base_output_dir, job_id):
                 legacy_format['output']['base_path'] = f'{base_output_dir.rstrip("/")}/{job_id}'
             else:
                 legacy_format['output']['base_path'] = base_output_dir
         elif output_format in ['mp4', 'webm', 'mkv', 'avi', 'mov']:
             base_output_path = config.get('outputDir', f'/output/files/{job_id}/output.{output_format}')
-            if job_id not in base_output_path:
-                if base_output_path.endswith(('.mp4', '.webm', '.mkv', '.avi', '.mov')):
-                    dir_part = base_output_path.rsplit('/', 1)[0] if '/' in base_output_path else '/output/files'
-                    file_part = base_output_path.rsplit('/', 1)[1] if '/' in base_output_path else base_output_path
+            if not _path_contains_id(base_output_path, job_id):
+                if base_output_path.endswith(_VIDEO_EXTS):
+                    head, sep, tail = base_output_path.rpartition('/')
+                    dir_part = head if sep else '/output/files'
+                    file_part = tail if sep else base_output_path
                     legacy_format['output']['base_path'] = f'{dir_part}/{job_id}/{file_part}'
                 else:
                     legacy_format['output']['base_path'] = f'{base_output_path.rstrip("/")}/{job_id}'
@@ -794,67 +1147,70 @@ class JobManager:
             await conn.execute("BEGIN")
 
             try:
-                # Update encoding_jobs table
-                job_fields = legacy_format['job']
-                job_fields.pop('id', None)  # Don't update ID
-                job_fields.pop('updated_at', None)  # Column doesn't exist in current schema
-                job_fields.pop('created_at', None)  # Don't update created_at
-
-                if job_fields:
-                    job_set_clause = ', '.join([f"{k} = ?" for k in job_fields.keys()])
-                    job_values = list(job_fields.values()) + [job_id]
-                    await conn.execute(
-                        f"UPDATE encoding_jobs SET {job_set_clause} WHERE id = ?",
-                        job_values
-                    )
+                # Current rows, so that only columns whose value changed are written
+                current = await self._fetch_job_rows(conn, job_id)
+                current_job, current_input, current_output = current or (None, None, None)
 
                 # Update input_sources table
-                input_fields = legacy_format['input']
-                input_fields.pop('job_id', None)  # Don't update job_id
+                legacy_format['input'].pop('job_id', None)  # Don't update job_id
+                input_fields = _changed_fields(
+                    _filter_columns(legacy_format['input'], _INPUT_UPDATE_COLUMNS, 'input_sources'),
+                    current_input
+                )
 
                 if input_fields:
-                    input_set_clause = ', '.join([f"{k} = ?" for k in input_fields.keys()])
                     input_values = list(input_fields.values()) + [job_id]
                     await conn.execute(
-                        f"UPDATE input_sources SET {input_set_clause} WHERE job_id = ?",
+                        _build_update_sql('input_sources', tuple(input_fields), 'job_id'),
                         input_values
                     )
 
                 # Update output_configurations table
-                output_fields = legacy_format['output']
-                output_fields.pop('job_id', None)  # Don't update job_id
+                legacy_format['output'].pop('job_id', None)  # Don't update job_id
+                output_fields = _changed_fields(
+                    _filter_columns(legacy_format['output'], _OUTPUT_UPDATE_COLUMNS, 'output_configurations'),
+                    current_output
+                )
 
                 if output_fields:
-                    output_set_clause = ', '.join([f"{k} = ?" for k in output_fields.keys()])
                     output_values = list(output_fields.values()) + [job_id]
                     await conn.execute(
-                        f"UPDATE output_configurations SET {output_set_clause} WHERE job_id = ?",
+                        _build_update_sql('output_configurations', tuple(output_fields), 'job_id'),
                         output_values
                     )
 
+                # Update encoding_jobs table
+                # Don't update id or created_at; updated_at is not a column in the current schema
+                for key in ('id', 'created_at', 'updated_at'):
+                    legacy_format['job'].pop(key, None)
+                job_fields = _filter_columns(legacy_format['job'], _JOB_UPDATE_COLUMNS, 'encoding_jobs')
+
                 # Regenerate FFmpeg command based on new configuration
                 # Phase 7: Removed config merge that was overwriting updates with old cache
-                new_command = self._build_command_from_unified_config(config, job_id)
+                new_command = self._command_for_unified_config(config, job_id)
                 if new_command:
                     # Add command to config so it's included in cache
                     config['ffmpegCommand'] = new_command
-
-                    await conn.execute(
-                        "UPDATE encoding_jobs SET command = ? WHERE id = ?",
-                        (new_command, job_id)
-                    )
+                    job_fields['command'] = new_command
                     logger.info(f"Regenerated FFmpeg command for job {job_id}")
 
-                # Update full_config cache (with datetime serialization and command included)
-                def json_serializer(obj):
-                    if isinstance(obj, datetime):
-                        return obj.isoformat()
-                    raise TypeError(f"Type {type(obj)} not serializable")
+                # Command and full_config cache (with datetime serialization and
+                # command included) go out in the same row write as the job
+                # fields. This runs after the output_configurations UPDATE,
+                # whose invalidate_config_cache trigger clears full_config.
+                full_config = orjson.dumps(config, default=_json_default).decode()
+                job_fields['full_config'] = full_config
+                job_fields = _changed_fields(job_fields, current_job)
+                if output_fields:
+                    # The trigger cleared full_config, so it must be rewritten
+                    job_fields['full_config'] = full_config
 
-                await conn.execute(
-                    "UPDATE encoding_jobs SET full_config = ? WHERE id = ?",
-                    (json.dumps(config, default=json_serializer), job_id)
-                )
+                if job_fields:
+                    job_values = list(job_fields.values()) + [job_id]
+                    await conn.execute(
+                        _build_update_sql('encoding_jobs', tuple(job_fields), 'id'),
+                        job_values
+                    )
 
                 await conn.commit()
                 logger.info(f"Updated job {job_id} using unified API (cache + normalized tables + command)")
@@ -864,6 +1220,31 @@ class JobManager:
                 logger.error(f"Failed to update job {job_id}: {e}", exc_info=True)
                 raise
 
+    def _command_for_unified_config(self, config: Dict[str, Any], job_id: str) -> str:
+        """
+        Return the FFmpeg command for a unified config, reusing the last one
+        generated for this job when none of the keys the builder reads changed.
+
+        Saving a job with only its name or other metadata edited then skips
+        the builder (and the pydantic models it constructs for ABR jobs).
+        """
+        key = orjson.dumps(
+            [config.get(k) for k in _COMMAND_CONFIG_KEYS],
+            default=_json_default,
+            option=orjson.OPT_SORT_KEYS,
+        )
+        cached = self._command_cache.get(job_id)
+        if cached is not None and cached[0] == key:
+            self._command_cache.move_to_end(job_id)
+            return cached[1]
+
+        command = self._build_command_from_unified_config(config, job_id)
+        self._command_cache[job_id] = (key, command)
+        self._command_cache.move_to_end(job_id)
+        if len(self._command_cache) > _COMMAND_CACHE_MAX_SIZE:
+            self._command_cache.popitem(last=False)
+        return command
+
     def _build_command_from_unified_config(self, config: Dict[str, Any], job_id: str) -> str:
         """
         Build FFmpeg command from unified configuration.
@@ -880,21 +1261,16 @@ class JobManager:
 
         Feature: 001-edit-api-simplification
         """
-        import shlex
-
         # If ABR is enabled, use proper ABR builder (handles filter_complex for multi-variant)
         if config.get('abrEnabled') and config.get('abrLadder'):
-            from models.encoding_settings import CreateJobRequest, HLSOutput, UDPOutput
-            from models.rendition import RenditionCreate
-            from services.ffmpeg.command_builder import build_ffmpeg_command
-
             # Map camelCase to snake_case and create RenditionCreate objects
             # Use main job's codec/audio settings as defaults for renditions
             main_video_codec = config.get('videoCodec', 'h264')
             main_audio_codec = config.get('audioCodec', 'aac')
             main_audio_bitrate = config.get('audioBitrate', '128k')
+            main_audio_volume = config.get('audioVolume')
 
-            renditions_create = []
+            rendition_dicts = []
             for r in config.get('abrLadder', []):
                 # Determine video codec for this rendition
                 rendition_codec = r.get('videoCodec', main_video_codec)
@@ -905,33 +1281,25 @@ class JobManager:
                 else:
                     default_profile = 'main'  # H.264/H.265 default
 
-                # Get audio volume from rendition or fall back to main job config
-                main_audio_volume = config.get('audioVolume')
-                rendition_audio_volume = r.get('audioVolume', main_audio_volume)
-
-                rendition_data = {
-                    'name': r.get('name', ''),
-                    'video_bitrate': r.get('videoBitrate', ''),
-                    'video_resolution': r.get('videoResolution', '1920x1080'),
-                    'video_framerate': r.get('videoFrameRate') or config.get('videoFrameRate'),  # Fall back to main job FPS
-                    'video_codec': rendition_codec,  # Use main job codec if not specified
-                    'video_profile': r.get('videoProfile', default_profile),
-                    'audio_codec': r.get('audioCodec', main_audio_codec),  # Use main job audio codec
-                    'audio_bitrate': r.get('audioBitrate', main_audio_bitrate),  # Use main job audio bitrate
-                    'audio_channels': r.get('audioChannels') or config.get('audioChannels', 2),  # Fall back to main job channels
-                    'audio_sample_rate': r.get('audioSampleRate', 48000),
-                    'audio_volume': rendition_audio_volume,  # Audio volume percentage (0-100)
-                    'preset': r.get('videoPreset') or config.get('videoPreset', 'medium'),  # Fall back to main job preset
-                    'max_bitrate': r.get('maxBitrate'),
-                    'buffer_size': r.get('bufferSize'),
-                    'output_url': r.get('outputUrl'),  # For UDP ABR: each rendition can have its own output URL
-                }
-                renditions_create.append(RenditionCreate(**rendition_data))
+                rendition_data = {snake: r.get(camel, default) for snake, camel, default in _RENDITION_FIELD_MAP}
+                # Fields that fall back to the main job's settings
+                rendition_data.update(
+                    video_framerate=r.get('videoFrameRate') or config.get('videoFrameRate'),
+                    video_codec=rendition_codec,
+                    video_profile=r.get('videoProfile', default_profile),
+                    audio_codec=r.get('audioCodec', main_audio_codec),
+                    audio_bitrate=r.get('audioBitrate', main_audio_bitrate),
+                    audio_channels=r.get('audioChannels') or config.get('audioChannels', 2),
+                    audio_volume=r.get('audioVolume', main_audio_volume),  # Audio volume percentage (0-100)
+                    preset=r.get('videoPreset') or config.get('videoPreset', 'medium'),
+                )
+                rendition_dicts.append(rendition_data)
+
+            renditions_create = _RENDITION_LIST_ADAPTER.validate_python(rendition_dicts)
 
             # Convert simplified codec names to FFmpeg format
-            codec_map = {'h264': 'libx264', 'h265': 'libx265', 'vp9': 'libvpx-vp9', 'av1': 'libaom-av1'}
             video_codec = config.get('videoCodec', 'h264')
-            video_codec = codec_map.get(video_codec, video_codec)  # Convert h264 -> libx264
+            video_codec = _CODEC_MAP.get(video_codec, video_codec)  # Convert h264 -> libx264
 
             # Check output format to determine HLS or UDP
             output_format = config.get('outputFormat', 'hls')
@@ -939,7 +1307,6 @@ class JobManager:
             if output_format == 'udp':
                 # ABR UDP: Create UDP outputs from first rendition's outputUrl or main outputUrl
                 # Parse the base UDP URL from the main outputUrl or first rendition
-                import re
                 base_udp_url = config.get('outputUrl')
                 if not base_udp_url and config.get('abrLadder'):
                     # Use first rendition's outputUrl as base
@@ -949,7 +1316,7 @@ class JobManager:
                     raise ValueError("UDP output format requires outputUrl")
 
                 # Parse UDP URL to create UDPOutput object
-                udp_match = re.match(r'udp://([^:]+):(\d+)(?:\?ttl=(\d+))?', base_udp_url)
+                udp_match = _UDP_URL_RE.match(base_udp_url)
                 if not udp_match:
                     raise ValueError(f"Invalid UDP URL format: {base_udp_url}")
 
@@ -962,7 +1329,6 @@ class JobManager:
                 # Convert streamMaps format (camelCase dict) to StreamMap objects
                 stream_maps = []
                 if config.get('streamMaps'):
-                    from models.encoding_settings import StreamMap
                     for sm in config.get('streamMaps', []):
                         stream_maps.append(StreamMap(
                             input_stream=sm.get('input_stream'),
@@ -986,7 +1352,7 @@ class JobManager:
                 # ABR HLS: Create HLS output configuration
                 # Feature 008: Ensure job_id is included in ABR HLS output path
                 base_output_dir = config.get('outputDir', '/output/hls')
-                if job_id not in base_output_dir:
+                if not _path_contains_id(base_output_dir, job_id):
                     abr_output_dir = f'{base_output_dir.rstrip("/")}/{job_id}'
                 else:
                     abr_output_dir = base_output_dir
@@ -1004,7 +1370,6 @@ class JobManager:
                 # Convert streamMaps format (camelCase dict) to StreamMap objects
                 stream_maps = []
                 if config.get('streamMaps'):
-                    from models.encoding_settings import StreamMap
                     for sm in config.get('streamMaps', []):
                         stream_maps.append(StreamMap(
                             input_stream=sm.get('input_stream'),
@@ -1025,7 +1390,6 @@ class JobManager:
                     stream_maps=stream_maps,
                 )
 
-            cmd_list = build_ffmpeg_command(request)
             cmd_list = build_ffmpeg_command(request)
             cmd_str = shlex.join(cmd_list)
             # Hack to quote 0:0 for avfoundation if requested (visual only, shlex.split removes it)
@@ -1038,13 +1402,8 @@ class JobManager:
 
         # Hardware acceleration (must be BEFORE input)
         hw_accel = config.get('hardwareAccel', 'none')
-        if hw_accel and hw_accel != 'none':
-            if hw_accel == 'nvenc':
-                cmd.extend(['-hwaccel', 'cuda'])
-            elif hw_accel == 'vaapi':
-                cmd.extend(['-hwaccel', 'vaapi'])
-            elif hw_accel == 'videotoolbox':
-                cmd.extend(['-hwaccel', 'videotoolbox'])
+        if hw_accel in _HWACCEL_DECODERS:
+            cmd.extend(('-hwaccel', _HWACCEL_DECODERS[hw_accel]))
 
         # Input with loop (must be BEFORE input for continuous streaming)
         if config.get('loopInput'):
@@ -1067,63 +1426,21 @@ class JobManager:
         has_audio_map = False
         if stream_maps:
             # Use explicit track selection from streamMaps
-            for stream_map in stream_maps:
-                cmd.extend(['-map', stream_map.get('input_stream')])
-                if stream_map.get('output_label') == 'a':
-                    has_audio_map = True
+            cmd.extend(chain.from_iterable(('-map', sm.get('input_stream')) for sm in stream_maps))
+            has_audio_map = any(sm.get('output_label') == 'a' for sm in stream_maps)
         else:
             # Default: map first video and first audio stream
             cmd.extend(['-map', '0:v:0', '-map', '0:a:0'])
             has_audio_map = True
 
         # Video codec and settings
-        video_codec = config.get('videoCodec', 'h264')
-        actual_codec = None
-
-        # Hardware encoder codec mapping
-        hw_codec_map = {
-            'nvenc': {
-                'h264': 'h264_nvenc', 'libx264': 'h264_nvenc',
-                'h265': 'hevc_nvenc', 'hevc': 'hevc_nvenc', 'libx265': 'hevc_nvenc',
-                'av1': 'av1_nvenc', 'libaom-av1': 'av1_nvenc',
-            },
-            'vaapi': {
-                'h264': 'h264_vaapi', 'libx264': 'h264_vaapi',
-                'h265': 'hevc_vaapi', 'hevc': 'hevc_vaapi', 'libx265': 'hevc_vaapi',
-                'av1': 'av1_vaapi', 'libaom-av1': 'av1_vaapi',
-            },
-            'videotoolbox': {
-                'h264': 'h264_videotoolbox', 'libx264': 'h264_videotoolbox',
-                'h265': 'hevc_videotoolbox', 'hevc': 'hevc_videotoolbox', 'libx265': 'hevc_videotoolbox',
-                # Note: AV1 is not supported by VideoToolbox
-            },
-        }
-
-        if hw_accel and hw_accel != 'none' and hw_accel in hw_codec_map:
-            actual_codec = hw_codec_map[hw_accel].get(video_codec, f'{video_codec}_{hw_accel}')
-            cmd.extend(['-c:v', actual_codec])
-        else:
-            # Software codec: Map simplified codec to FFmpeg lib name
-            codec_map = {'h264': 'libx264', 'h265': 'libx265', 'vp9': 'libvpx-vp9', 'av1': 'libaom-av1'}
-            actual_codec = codec_map.get(video_codec, 'libx264')
-            cmd.extend(['-c:v', actual_codec])
-
-        # Add video codec tag for HEVC compatibility (hvc1 works better than hev1 on Apple devices)
-        if 'hevc' in actual_codec.lower() or 'h265' in video_codec.lower() or '265' in video_codec.lower():
-            cmd.extend(['-tag:v', 'hvc1'])
+        cmd.extend(_video_encoder_args(hw_accel, config.get('videoCodec', 'h264')))
 
         # Video encoding settings
-        if config.get('videoBitrate'):
-            cmd.extend(['-b:v', config['videoBitrate']])
-
-        if config.get('videoFrameRate'):
-            cmd.extend(['-r', str(config['videoFrameRate'])])
-
-        if config.get('videoPreset'):
-            cmd.extend(['-preset', config['videoPreset']])
-
-        if config.get('videoProfile'):
-            cmd.extend(['-profile:v', config['videoProfile']])
+        for key, flag in _VIDEO_OPTION_FLAGS:
+            value = config.get(key)
+            if value:
+                cmd.extend((flag, str(value)))
 
         # Video filters (scale uses -vf for consistency with command_builder.py)
         filters = []
@@ -1151,11 +1468,10 @@ class JobManager:
             else:
                 cmd.extend(['-c:a', audio_codec])
 
-                if config.get('audioBitrate'):
-                    cmd.extend(['-b:a', config['audioBitrate']])
-
-                if config.get('audioChannels'):
-                    cmd.extend(['-ac', str(config['audioChannels'])])
+                for key, flag in _AUDIO_OPTION_FLAGS:
+                    value = config.get(key)
+                    if value:
+                        cmd.extend((flag, str(value)))
 
                 # Audio volume filter (0-100 percentage)
                 audio_volume = config.get('audioVolume')
@@ -1173,7 +1489,7 @@ class JobManager:
 
             # Feature 008: Ensure job_id is included in HLS output path
             # This prevents segment conflicts between jobs
-            if job_id not in base_output_dir:
+            if not _path_contains_id(base_output_dir, job_id):
                 output_dir = f'{base_output_dir.rstrip("/")}/{job_id}'
             else:
                 output_dir = base_output_dir
@@ -1251,12 +1567,13 @@ class JobManager:
                 base_output_path = config.get('outputDir', f'/output/files/{job_id}/output.mp4')
 
                 # If path doesn't include job_id, add it
-                if job_id not in base_output_path:
+                if not _path_contains_id(base_output_path, job_id):
                     # Check if it's a directory or full file path
-                    if base_output_path.endswith(('.mp4', '.webm', '.mkv', '.avi', '.mov')):
+                    if base_output_path.endswith(_VIDEO_EXTS):
                         # It's a file path - insert job_id before filename
-                        dir_part = base_output_path.rsplit('/', 1)[0] if '/' in base_output_path else '/output/files'
-                        file_part = base_output_path.rsplit('/', 1)[1] if '/' in base_output_path else base_output_path
+                        head, sep, tail = base_output_path.rpartition('/')
+                        dir_part = head if sep else '/output/files'
+                        file_part = tail if sep else base_output_path
                         output_path = f'{dir_part}/{job_id}/{file_part}'
                     else:
                         # It's a directory - append job_id and filename
@@ -1283,16 +1600,10 @@ class JobManager:
         Feature: 001-edit-api-simplification
         """
         try:
-            # Handle datetime serialization
-            def json_serializer(obj):
-                """Custom JSON serializer for datetime objects"""
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                raise TypeError(f"Type {type(obj)} not serializable")
-
+            # orjson serializes datetimes natively (ISO 8601, like isoformat())
             await self.db.execute(
                 "UPDATE encoding_jobs SET full_config = ? WHERE id = ?",
-                (json.dumps(unified_config, default=json_serializer), job_id)
+                (orjson.dumps(unified_config).decode(), job_id)
             )
             logger.debug(f"Updated cache for job {job_id}")
         except Exception as e:
@@ -1323,25 +1634,23 @@ class JobManager:
 
         async with self.db.get_connection() as conn:
             try:
-                # Update the command in encoding_jobs table
-                await conn.execute(
-                    "UPDATE encoding_jobs SET command = ? WHERE id = ?",
-                    (command, job_id)
-                )
-
-                # Also update the command in full_config cache
+                # Read the full_config cache so the command can be updated there too
                 row = await conn.execute(
                     "SELECT full_config FROM encoding_jobs WHERE id = ?",
                     (job_id,)
                 )
                 result = await row.fetchone()
-                if result and result[0]:
-                    config = json.loads(result[0])
+                full_config = result[0] if result else None
+                if full_config:
+                    config = orjson.loads(full_config)
                     config['ffmpegCommand'] = command
-                    await conn.execute(
-                        "UPDATE encoding_jobs SET full_config = ? WHERE id = ?",
-                        (json.dumps(config), job_id)
-                    )
+                    full_config = orjson.dumps(config, default=_json_default).decode()
+
+                # Update the command and the cache in one row write
+                await conn.execute(
+                    "UPDATE encoding_jobs SET command = ?, full_config = ? WHERE id = ?",
+                    (command, full_config, job_id)
+                )
 
                 await conn.commit()
                 logger.info(f"Updated custom FFmpeg command for job {job_id}")
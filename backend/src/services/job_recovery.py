@@ -5,15 +5,54 @@ Handles automatic restart of jobs on container restart
 
 import logging
 import asyncio
-from typing import List
+import os
+import shutil
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from services.job_state import job_state_manager
 from services.job_manager import job_manager
-from models.job import JobStatus
+from services.simple_ffmpeg import simple_ffmpeg_launcher
+from models.job import EncodingJob, JobStatus
+from models.input import InputSource
+from models.output import OutputConfiguration, OutputType
 
 logger = logging.getLogger(__name__)
 
 
+def _read_log_tail(log_file: Path, max_lines: int, max_bytes: int = 64 * 1024) -> str:
+    """Return the last max_lines lines of a log file, reading at most its last max_bytes"""
+    with open(log_file, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        start = max(0, size - max_bytes)
+        f.seek(start)
+        tail = f.read().decode('utf-8', errors='replace')
+
+    lines = tail.splitlines(keepends=True)
+    if start > 0 and lines:
+        lines = lines[1:]  # First line is probably cut off by the seek
+    return ''.join(lines[-max_lines:])
+
+
+def _pid_gone(pid: int) -> bool:
+    """Check whether a process ID no longer exists (signal 0 probes without signalling)"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        return False  # Exists but owned by another user
+    return False
+
+
+def _make_dirs(paths: List[str]) -> None:
+    """Create each directory (and missing parents) if it doesn't exist"""
+    for path in paths:
+        os.makedirs(path, exist_ok=True)
+
+
 class JobRecoveryService:
     """Manages job recovery on application restart"""
 
@@ -21,6 +60,8 @@ class JobRecoveryService:
         """Initialize job recovery service"""
         self.state_manager = job_state_manager
         self.job_manager = job_manager
+        # Number of recovered jobs restarted concurrently
+        self.recovery_parallelism = max(1, int(os.getenv("RECOVERY_PARALLELISM", "4")))
 
     async def recover_and_restart_jobs(self) -> int:
         """Recover jobs that were running before container restart and restart them
@@ -75,7 +116,39 @@ class JobRecoveryService:
             logger.error(f"Job recovery failed: {e}")
             return 0
 
-    async def start_recovered_job(self, job_id: str) -> bool:
+    @staticmethod
+    async def _wait_until(condition: Callable[[], bool], timeout: float) -> bool:
+        """Poll condition with exponential backoff until it holds or timeout expires
+
+        Returns:
+            bool: True if the condition held before the timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.05
+        while not condition():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.5)
+        return True
+
+    async def _wait_pid_gone(self, pid: int, timeout: float) -> bool:
+        """Wait until the process with the given PID has exited
+
+        Returns:
+            bool: True if the process was gone before the timeout
+        """
+        return await self._wait_until(lambda: _pid_gone(pid), timeout=timeout)
+
+    async def start_recovered_job(
+        self,
+        job_id: str,
+        prefetched: Optional[Dict[str, Any]] = None,
+        index: Optional[int] = None,
+        total: Optional[int] = None
+    ) -> bool:
         """Start a specific recovered job
 
         This is a helper method that can be called to automatically restart
@@ -84,38 +157,51 @@ class JobRecoveryService:
 
         Args:
             job_id: Job ID to start
+            prefetched: Job with config as returned by get_job_with_config(),
+                if the caller already fetched it
+            index: 1-based position of the job in a recovery batch, for the summary log
+            total: Size of the recovery batch, for the summary log
 
         Returns:
             bool: True if job started successfully
         """
+        # Outlives the try block so the error path can reuse it instead of refetching
+        job: Optional[EncodingJob] = None
+        # Step timings, logged once as a single summary record when the job is up
+        steps: List[Tuple[str, float]] = []
+        step_start = time.monotonic()
+
+        def end_step(name: str) -> None:
+            nonlocal step_start
+            now = time.monotonic()
+            steps.append((name, now - step_start))
+            step_start = now
+
         try:
-            from models.job import EncodingJob
-            from models.input import InputSource
-            from models.output import OutputConfiguration
-            from services.simple_ffmpeg import simple_ffmpeg_launcher
-            from services.output_manager import output_manager
-            from typing import Dict, Any
-            import shutil
-            from pathlib import Path
+            # Get job with configuration first so the stop and wait can use its PID
+            job_data = prefetched
+            if job_data is None:
+                job_data = await self.job_manager.get_job_with_config(job_id)
 
-            logger.info(f"Attempting to auto-restart job {job_id}")
+            # PID of the process to wait for: the tracked one, else whatever the database still has
+            tracked = simple_ffmpeg_launcher.active_processes.get(job_id)
+            pid = tracked.pid if tracked else (job_data['job'].get('pid') if job_data else None)
 
             # STEP 1: STOP any orphaned FFmpeg processes for this job
-            logger.info(f"STEP 1: Stopping any orphaned processes for job {job_id}")
             try:
-                await simple_ffmpeg_launcher.stop_encoding(job_id, timeout=10)
-                logger.info(f"Stopped orphaned processes for job {job_id}")
+                await simple_ffmpeg_launcher.stop_encoding(job_id, timeout=10, pid=pid)
             except Exception as stop_error:
                 logger.warning(f"Error stopping orphaned processes for job {job_id}: {stop_error}")
                 # Continue anyway
 
-            # STEP 2: Wait 30 seconds for processes to fully terminate and cleanup
-            logger.info(f"STEP 2: Waiting 30 seconds for complete process cleanup for job {job_id}")
-            await asyncio.sleep(30)
-            logger.info(f"Cleanup wait completed for job {job_id}")
+            end_step("stop")
+
+            # STEP 2: Wait (up to 30 seconds) for the process to exit. Without a known PID
+            # there is nothing to poll; stop_encoding() has already killed any orphan it found.
+            if pid and not await self._wait_pid_gone(pid, 30):
+                logger.warning(f"FFmpeg process {pid} for job {job_id} still present after 30 seconds, continuing")
+            end_step("wait_stop")
 
-            # Get job with configuration
-            job_data = await self.job_manager.get_job_with_config(job_id)
             if not job_data:
                 logger.error(f"Job {job_id} not found")
                 return False
@@ -134,11 +220,10 @@ class JobRecoveryService:
 
             input_source = InputSource(**job_data['input'])
             output_config = OutputConfiguration(**job_data['output'])
+            end_step("load")
 
             # STEP 3: Directory setup for HLS outputs only
             # For UDP/RTMP/SRT/FILE outputs, base_path is None and no directories are needed
-            from models.output import OutputType
-
             if output_config.output_type == OutputType.HLS:
                 # Validate HLS jobs have a valid base path
                 if not output_config.base_path or not output_config.base_path.strip():
@@ -150,84 +235,49 @@ class JobRecoveryService:
                 try:
                     base_path = output_config.base_path
                     if Path(base_path).exists():
-                        logger.info(f"STEP 3: Cleaning HLS output directory: {base_path}")
-                        shutil.rmtree(base_path)
-                        await asyncio.sleep(5)  # Wait longer for filesystem
-                        logger.info(f"HLS output directory cleaned for job {job_id}")
-                    else:
-                        logger.info(f"No old HLS output directory for job {job_id}")
+                        # Large HLS directories can take seconds to delete; keep the loop free
+                        await asyncio.to_thread(shutil.rmtree, base_path)
+                        # Wait (up to 5 seconds) for the filesystem to drop the directory
+                        await self._wait_until(lambda: not os.path.exists(base_path), timeout=5)
 
                 except Exception as cleanup_error:
                     logger.error(f"Failed to cleanup HLS output directory for job {job_id}: {cleanup_error}")
+                end_step("cleanup")
 
                 # STEP 3.5: Create fresh directory structure for HLS
-                logger.info(f"STEP 3.5: Creating fresh HLS directory structure for job {job_id}")
                 try:
                     base_path = output_config.base_path
-                    Path(base_path).mkdir(parents=True, exist_ok=True)
-                    logger.info(f"Created HLS base directory: {base_path}")
 
-                    # Check if ABR or single stream
-                    output_dict = output_config.dict()
-                    is_abr = output_dict.get("abr_enabled", False)
+                    # Check if ABR or single stream (read fields directly, no .dict() walk)
+                    is_abr = output_config.abr_enabled
 
                     if is_abr:
-                        renditions = output_dict.get("renditions", [])
-                        for rendition in renditions:
-                            rendition_name = rendition.get("name") if isinstance(rendition, dict) else rendition.name
-                            rendition_path = f"{base_path}/{rendition_name}"
-                            Path(rendition_path).mkdir(parents=True, exist_ok=True)
-                            logger.info(f"Created rendition directory: {rendition_path}")
+                        subdirs = [
+                            os.path.join(base_path, r["name"] if isinstance(r, dict) else r.name)
+                            for r in output_config.renditions or []
+                        ]
                     else:
                         # Create /stream subdirectory for single stream mode
-                        stream_path = f"{base_path}/stream"
-                        Path(stream_path).mkdir(parents=True, exist_ok=True)
-                        logger.info(f"Created stream directory: {stream_path}")
+                        subdirs = [os.path.join(base_path, "stream")]
+
+                    # One worker-thread hop for all mkdirs instead of blocking the loop per directory
+                    await asyncio.to_thread(_make_dirs, [base_path, *subdirs])
 
-                    await asyncio.sleep(2)  # Wait for filesystem to confirm
-                    logger.info(f"HLS directory structure ready for job {job_id}")
+                    # Wait (up to 2 seconds) for filesystem to confirm
+                    await self._wait_until(lambda: os.path.isdir(base_path), timeout=2)
+                    end_step("mkdirs")
 
                 except Exception as dir_error:
                     logger.error(f"Failed to create HLS directories for job {job_id}: {dir_error}")
                     return False
-            else:
-                # Non-HLS output types (UDP, RTMP, SRT, FILE) don't need directory setup
-                logger.info(f"Job {job_id} is {output_config.output_type} type - skipping directory setup")
-
-            # Define callbacks for progress tracking
-            async def on_progress(job_id: str, progress: Dict[str, Any]):
-                logger.debug(f"Job {job_id} progress: {progress}")
-
-            async def on_error(job_id: str, error: str):
-                logger.error(f"Job {job_id} FFmpeg stderr: {error}")
-                await self.state_manager.mark_job_error(job, error)
-
-            async def on_complete(job_id: str, exit_code: int):
-                if exit_code == 0:
-                    logger.info(f"Job {job_id} completed successfully")
-                    await self.state_manager.mark_job_completed(job)
-                else:
-                    error_msg = f"FFmpeg exited with code {exit_code}"
-                    logger.error(f"Job {job_id} failed: {error_msg}")
-
-                    # Read last few lines of log file for debugging
-                    try:
-                        log_file = Path(f"src/logs/{job_id}.log")
-                        if log_file.exists():
-                            with open(log_file, 'r') as f:
-                                lines = f.readlines()
-                                last_lines = ''.join(lines[-10:]) if len(lines) > 10 else ''.join(lines)
-                                logger.error(f"Job {job_id} last log lines:\n{last_lines}")
-                    except Exception as log_error:
-                        logger.error(f"Could not read log file for job {job_id}: {log_error}")
-
-                    await self.state_manager.mark_job_error(job, error_msg)
+            # Non-HLS output types (UDP, RTMP, SRT, FILE) don't need directory setup
 
             # STEP 4: Start fresh FFmpeg process
-            logger.info(f"STEP 4: Starting fresh FFmpeg process for job {job_id}")
             started = await simple_ffmpeg_launcher.start_encoding(
                 job, input_source, output_config,
-                on_progress, on_error, on_complete
+                self._on_progress,
+                partial(self._on_error, job),
+                partial(self._on_complete, job)
             )
 
             if not started:
@@ -239,40 +289,94 @@ class JobRecoveryService:
             # Get the actual PID from the process manager
             if job_id in simple_ffmpeg_launcher.active_processes:
                 actual_pid = simple_ffmpeg_launcher.active_processes[job_id].pid
-                logger.info(f"Job {job_id} FFmpeg process started with PID {actual_pid}")
             else:
                 actual_pid = job.pid or 0
                 logger.warning(f"Job {job_id} not found in active_processes, using job.pid: {actual_pid}")
 
             # Update job status to RUNNING with the correct PID
-            logger.info(f"Marking job {job_id} as RUNNING with PID {actual_pid}")
-            updated_job = await self.state_manager.mark_job_running(job, actual_pid)
-            logger.info(f"Job {job_id} status after mark_job_running: {updated_job.status}, PID: {updated_job.pid}")
+            end_step("start")
+            await self.state_manager.mark_job_running(job, actual_pid)
 
             # Verify the database was updated
             verify_job = await self.job_manager.get_job(job_id)
             if verify_job:
-                logger.info(f"Database verification - Job {job_id} status: {verify_job.status}, PID: {verify_job.pid}")
                 if verify_job.status != JobStatus.RUNNING:
                     logger.error(f"BUG: Job {job_id} not marked as RUNNING in database! Status is {verify_job.status}")
             else:
                 logger.error(f"BUG: Could not verify job {job_id} in database after recovery!")
 
-            logger.info(f"✓ Successfully restarted job {job_id} with PID {actual_pid}")
+            end_step("mark_running")
+
+            timings = ", ".join(f"{name}={elapsed:.2f}s" for name, elapsed in steps)
+            position = f"{index}/{total} " if index is not None else ""
+            logger.info(
+                f"✓ Successfully restarted job {position}{job_id} with PID {actual_pid} ({timings})",
+                extra={"job_id": job_id, "steps": steps, "pid": actual_pid, "index": index, "total": total}
+            )
             return True
 
         except Exception as e:
             logger.error(f"Error auto-restarting job {job_id}: {e}", exc_info=True)
             # Try to mark job as error
             try:
-                job_data = await self.job_manager.get_job_with_config(job_id)
-                if job_data:
-                    job = EncodingJob(**job_data['job'])
+                if job is None:
+                    # Failed before the job was loaded
+                    job_data = await self.job_manager.get_job_with_config(job_id)
+                    if job_data:
+                        job = EncodingJob(**job_data['job'])
+                if job is not None:
                     await self.state_manager.mark_job_error(job, f"Recovery failed: {str(e)}")
             except:
                 pass
             return False
 
+    async def _on_progress(self, job_id: str, progress: Dict[str, Any]) -> None:
+        """Progress callback for a recovered job's FFmpeg process"""
+        # Called for every progress line; skip building the message unless debug is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Job {job_id} progress: {progress}")
+
+    async def _on_error(self, job: EncodingJob, job_id: str, error: str) -> None:
+        """Error callback for a recovered job's FFmpeg process (job bound with partial)"""
+        logger.error(f"Job {job_id} FFmpeg stderr: {error}")
+        await self.state_manager.mark_job_error(job, error)
+
+    async def _on_complete(self, job: EncodingJob, job_id: str, exit_code: int) -> None:
+        """Completion callback for a recovered job's FFmpeg process (job bound with partial)"""
+        if exit_code == 0:
+            logger.info(f"Job {job_id} completed successfully")
+            await self.state_manager.mark_job_completed(job)
+        else:
+            error_msg = f"FFmpeg exited with code {exit_code}"
+            logger.error(f"Job {job_id} failed: {error_msg}")
+
+            # Read last few lines of log file for debugging
+            try:
+                log_file = Path(f"src/logs/{job_id}.log")
+                if log_file.exists():
+                    last_lines = _read_log_tail(log_file, 10)
+                    logger.error(f"Job {job_id} last log lines:\n{last_lines}")
+            except Exception as log_error:
+                logger.error(f"Could not read log file for job {job_id}: {log_error}")
+
+            await self.state_manager.mark_job_error(job, error_msg)
+
+    async def _guarded_restart(
+        self,
+        semaphore: asyncio.Semaphore,
+        job_id: str,
+        index: int,
+        total: int,
+        prefetched: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Restart one recovered job while holding a slot of the recovery semaphore"""
+        async with semaphore:
+            # Success is logged by start_recovered_job() as the job's single summary record
+            started = await self.start_recovered_job(job_id, prefetched, index, total)
+            if not started:
+                logger.warning(f"Failed to restart job {index}/{total}: {job_id}")
+            return started
+
     async def recover_with_auto_restart(self) -> dict:
         """Recover jobs and automatically restart them
 
@@ -293,7 +397,7 @@ class JobRecoveryService:
                 }
 
             # Deduplicate job IDs in case of database issues
-            unique_job_ids = list(set(recovered_job_ids))
+            unique_job_ids = list(dict.fromkeys(recovered_job_ids))  # keeps first-seen order
             if len(unique_job_ids) < len(recovered_job_ids):
                 logger.warning(
                     f"Found {len(recovered_job_ids) - len(unique_job_ids)} duplicate job IDs, "
@@ -304,30 +408,35 @@ class JobRecoveryService:
             # Wait a moment for system to stabilize
             await asyncio.sleep(2)
 
-            # Try to restart each job with staggered delays
+            # Fetch all recovered jobs with their configuration in one query
+            try:
+                job_configs = await self.job_manager.get_jobs_with_configs(recovered_job_ids)
+            except Exception as e:
+                # e.g. one job's stored config no longer validates; fall back to per-job fetches
+                logger.warning(f"Could not batch-load recovered jobs, loading them one by one: {e}")
+                job_configs = {}
+
+            # Restart jobs concurrently, at most recovery_parallelism at a time
+            semaphore = asyncio.Semaphore(self.recovery_parallelism)
+            total = len(recovered_job_ids)
+            results = await asyncio.gather(
+                *(
+                    self._guarded_restart(semaphore, job_id, index, total, job_configs.get(job_id))
+                    for index, job_id in enumerate(recovered_job_ids, 1)
+                ),
+                return_exceptions=True
+            )
+
             restarted = 0
             failed = 0
-
-            for index, job_id in enumerate(recovered_job_ids, 1):
-                try:
-                    logger.info(f"Restarting job {index}/{len(recovered_job_ids)}: {job_id}")
-
-                    if await self.start_recovered_job(job_id):
-                        restarted += 1
-                        logger.info(f"Successfully restarted job {index}/{len(recovered_job_ids)}")
-                    else:
-                        failed += 1
-                        logger.warning(f"Failed to restart job {index}/{len(recovered_job_ids)}")
-                except Exception as e:
-                    logger.error(f"Exception restarting job {job_id}: {e}")
+            for job_id, result in zip(recovered_job_ids, results):
+                if result is True:
+                    restarted += 1
+                else:
+                    if isinstance(result, Exception):
+                        logger.error(f"Exception restarting job {job_id}: {result}")
                     failed += 1
 
-                # Increased delay between restarts to prevent resource conflicts
-                # Allow time for FFmpeg process to fully initialize and claim resources
-                if index < len(recovered_job_ids):  # Don't delay after last job
-                    logger.info(f"Waiting 10 seconds before starting next job...")
-                    await asyncio.sleep(10)
-
             stats = {
                 'recovered': len(recovered_job_ids),
                 'restarted': restarted,
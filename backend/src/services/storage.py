@@ -1,10 +1,11 @@
 """SQLite database connection and management"""
 
+import asyncio
 import os
 import sqlite3
 import aiosqlite
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,12 @@ class DatabaseService:
         default_db_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "jobs.db")
         self.db_path = db_path or os.getenv("DB_PATH", default_db_path)
         self.wal_mode = os.getenv("DB_WAL_MODE", "true").lower() == "true"
+        # Connections kept open between calls, and extra ones allowed under load
+        self.pool_size = int(os.getenv("DB_POOL_SIZE", "5"))
+        self.max_overflow = int(os.getenv("DB_POOL_MAX_OVERFLOW", "10"))
+        self._idle: List[aiosqlite.Connection] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pool_loop: Optional[asyncio.AbstractEventLoop] = None
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -43,7 +50,9 @@ class DatabaseService:
             raise
 
         try:
-            async with self.get_connection() as db:
+            # Use a connection outside the pool: the PRAGMAs below are
+            # per-connection and should not leak into pooled connections
+            async with self._unpooled_connection() as db:
                 # Try to enable WAL mode first (before testing write)
                 # WAL mode can fail on network filesystems or cross-platform volumes
                 if self.wal_mode:
@@ -94,19 +103,91 @@ class DatabaseService:
 
     @asynccontextmanager
     async def get_connection(self) -> AsyncIterator[aiosqlite.Connection]:
-        """Get a database connection
+        """Get a database connection from the pool
+
+        Up to pool_size connections stay open between calls; up to
+        max_overflow more are opened under load and closed on release.
+        A transaction left open by the caller is rolled back on release.
 
         Yields:
             aiosqlite.Connection: Database connection
         """
+        await self._ensure_pool()
+        slots = self._slots
+        await slots.acquire()
+        db = None
+        try:
+            db = self._idle.pop() if self._idle else await self._open_connection()
+            yield db
+        finally:
+            try:
+                if db is not None:
+                    await self._release_connection(db)
+            finally:
+                slots.release()
+
+    @asynccontextmanager
+    async def _unpooled_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Open a one-off connection that is closed on exit"""
+        db = await self._open_connection()
+        try:
+            yield db
+        finally:
+            await self._close_connection(db)
+
+    async def _ensure_pool(self) -> None:
+        """Set up pool state for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._pool_loop is loop:
+            return
+        # First use, or a new event loop (the semaphore is bound to the old one)
+        stale, self._idle = self._idle, []
+        self._slots = asyncio.Semaphore(self.pool_size + self.max_overflow)
+        self._pool_loop = loop
+        for db in stale:
+            await self._close_connection(db)
+
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """Open a new connection configured for this service"""
         # Get timeout from env var or use 30 seconds default (increased from 5s)
         timeout_ms = int(os.getenv("DB_BUSY_TIMEOUT", "30000"))
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            # Set busy timeout for this connection to handle concurrent writes better
-            await db.execute(f"PRAGMA busy_timeout = {timeout_ms}")
-            yield db
+        db = aiosqlite.connect(self.db_path)
+        # Idle pooled connections must not keep the interpreter alive at exit
+        db.daemon = True
+        await db
+        db.row_factory = aiosqlite.Row
+        # Set busy timeout for this connection to handle concurrent writes better
+        await db.execute(f"PRAGMA busy_timeout = {timeout_ms}")
+        return db
+
+    async def _release_connection(self, db: aiosqlite.Connection) -> None:
+        """Return a connection to the pool, or close it if the pool is full"""
+        try:
+            if db.in_transaction:
+                await db.rollback()
+        except Exception as e:
+            logger.warning(f"Discarding database connection after failed rollback: {e}")
+            await self._close_connection(db)
+            return
+
+        if len(self._idle) < self.pool_size:
+            self._idle.append(db)
+        else:
+            await self._close_connection(db)
+
+    async def _close_connection(self, db: aiosqlite.Connection) -> None:
+        """Close a connection, ignoring errors from already-broken ones"""
+        try:
+            await db.close()
+        except Exception as e:
+            logger.debug(f"Error closing database connection: {e}")
+
+    async def close(self) -> None:
+        """Close all idle pooled connections"""
+        idle, self._idle = self._idle, []
+        for db in idle:
+            await self._close_connection(db)
 
     async def execute(self, query: str, params: tuple = ()) -> None:
         """Execute a single query
@@ -0,0 +1,146 @@
+"""
+Tests for JobManager's unified-config command building.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import orjson
+
+import pytest
+
+from services.job_manager import JobManager
+
+JOB_ID = "abc-123"
+
+ABR_CONFIG = {
+    "inputFile": "/input/in.mp4",
+    "videoCodec": "h264",
+    "audioCodec": "aac",
+    "outputFormat": "hls",
+    "abrEnabled": True,
+    "abrLadder": [
+        {"name": "720p", "videoBitrate": "2M", "videoResolution": "1280x720"},
+        {"name": "480p", "videoBitrate": "1M", "videoResolution": "854x480"},
+    ],
+}
+
+
+@pytest.fixture
+def manager():
+    return JobManager()
+
+
+def test_abr_config_builds_command_once(manager):
+    """The ABR branch calls build_ffmpeg_command exactly once per build."""
+    with patch(
+        "services.job_manager.build_ffmpeg_command",
+        return_value=["ffmpeg", "-i", "/input/in.mp4", "out.m3u8"],
+    ) as build:
+        command = manager._build_command_from_unified_config(dict(ABR_CONFIG), JOB_ID)
+
+    build.assert_called_once()
+    request = build.call_args.args[0]
+    assert request.abr_enabled is True
+    assert len(request.abr_renditions) == 2
+    assert command == "ffmpeg -i /input/in.mp4 out.m3u8"
+
+
+class _KeyRecorder(dict):
+    """dict that records every key read through get/[]/in."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read = set()
+
+    def get(self, key, default=None):
+        self.read.add(key)
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        self.read.add(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self.read.add(key)
+        return super().__contains__(key)
+
+
+FULL_SINGLE_CONFIG = {
+    "inputFile": "/input/in.mp4",
+    "videoCodec": "h264",
+    "audioCodec": "aac",
+    "videoBitrate": "3M",
+    "videoFrameRate": 30,
+    "videoPreset": "fast",
+    "videoProfile": "high",
+    "videoResolution": "1280:720",
+    "videoFilters": "yadif",
+    "videoGOP": 60,
+    "audioBitrate": "128k",
+    "audioChannels": 2,
+    "audioVolume": 50,
+    "inputArgs": ["-re"],
+    "loopInput": True,
+    "streamMaps": [{"input_stream": "0:v:0", "output_label": "v"}],
+    "hlsPlaylistType": "live",
+    "hlsPlaylistSize": 5,
+    "hlsSegmentDuration": 4,
+    "hlsSegmentType": "mpegts",
+    "outputUrl": "udp://239.0.0.1:5000",
+    "udpOutputs": [{"url": "udp://239.0.0.2:5000"}],
+    "rtmpOutputs": [{"url": "rtmp://host/app", "streamKey": "key"}],
+}
+
+
+@pytest.mark.parametrize("config", [
+    *(dict(FULL_SINGLE_CONFIG, outputFormat=fmt, hardwareAccel=hw)
+      for fmt in ("hls", "udp", "rtmp", "mp4")
+      for hw in (None, "nvenc", "vaapi", "qsv", "videotoolbox")),
+    dict(FULL_SINGLE_CONFIG, outputFormat="file", outputDir="/output/files/out.mkv"),
+    dict(FULL_SINGLE_CONFIG, outputFormat="hls", inputFormat="avfoundation", inputFile="0:0"),
+    ABR_CONFIG,
+    dict(ABR_CONFIG, outputFormat="udp", outputUrl="udp://239.0.0.1:5000?ttl=3"),
+])
+def test_command_cache_key_covers_builder_reads(manager, config):
+    """Every config key the builder reads is part of the command cache key."""
+    from services.job_manager import _COMMAND_CONFIG_KEYS
+
+    recorder = _KeyRecorder(config)
+    manager._build_command_from_unified_config(recorder, JOB_ID)
+
+    assert recorder.read - set(_COMMAND_CONFIG_KEYS) == set()
+
+
+def test_command_cache_reuses_command_for_metadata_only_change(manager):
+    config = dict(FULL_SINGLE_CONFIG, outputFormat="hls", jobName="before")
+    first = manager._command_for_unified_config(config, JOB_ID)
+
+    with patch.object(manager, "_build_command_from_unified_config") as build:
+        second = manager._command_for_unified_config(dict(config, jobName="after"), JOB_ID)
+
+    build.assert_not_called()
+    assert second == first
+
+
+def test_command_cache_rebuilds_when_builder_input_changes(manager):
+    config = dict(FULL_SINGLE_CONFIG, outputFormat="hls")
+    first = manager._command_for_unified_config(config, JOB_ID)
+    second = manager._command_for_unified_config(dict(config, videoBitrate="5M"), JOB_ID)
+
+    assert second != first
+    assert "5M" in second
+
+
+async def test_get_job_unified_returns_independent_dicts(manager):
+    """Callers may edit the returned config without affecting later reads."""
+    stored = {"jobName": "job", "videoCodec": "h264", "abrLadder": [{"name": "720p"}]}
+    with patch.object(manager, "db") as db:
+        db.fetch_one = AsyncMock(return_value={"full_config": orjson.dumps(stored).decode()})
+
+        first = await manager.get_job_unified(JOB_ID)
+        first["jobName"] = "edited"
+        first["abrLadder"][0]["name"] = "1080p"
+        second = await manager.get_job_unified(JOB_ID)
+
+    assert second == stored
+    assert second is not first
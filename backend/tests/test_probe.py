@@ -0,0 +1,79 @@
+"""
+Tests for the in-process FFprobe result cache.
+"""
+
+import os
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from services.ffmpeg import probe
+
+PROBE_OUTPUT = orjson.dumps({
+    "format": {"duration": "12.5", "format_name": "mov,mp4", "bit_rate": "1000"},
+    "streams": [
+        {"index": 0, "codec_type": "video", "codec_name": "h264", "width": 1280, "height": 720,
+         "r_frame_rate": "30/1"},
+        {"index": 1, "codec_type": "audio", "codec_name": "aac", "channels": 2,
+         "sample_rate": "48000", "tags": {"language": "eng"}},
+    ],
+})
+
+
+class _FakeProcess:
+    returncode = 0
+
+    async def communicate(self):
+        return PROBE_OUTPUT, b""
+
+
+@pytest.fixture
+def ffprobe():
+    """Patch ffprobe spawning and yield the mock so tests can count calls."""
+    probe._PROBE_CACHE.clear()
+
+    async def spawn(*args, **kwargs):
+        return _FakeProcess()
+
+    with patch.object(probe.asyncio, "create_subprocess_exec", side_effect=spawn) as mock:
+        yield mock
+    probe._PROBE_CACHE.clear()
+
+
+@pytest.fixture
+def media_file(tmp_path):
+    path = tmp_path / "in.mp4"
+    path.write_bytes(b"x" * 16)
+    return str(path)
+
+
+async def test_unchanged_file_is_probed_once(ffprobe, media_file):
+    first = await probe.probe_input_file(media_file)
+    second = await probe.probe_input_file(media_file)
+
+    assert ffprobe.call_count == 1
+    assert second == first
+    assert len(first["tracks"]) == 2
+
+
+async def test_cached_result_is_not_shared_with_callers(ffprobe, media_file):
+    first = await probe.probe_input_file(media_file)
+    first["tracks"].clear()
+    first["duration"] = 0
+
+    second = await probe.probe_input_file(media_file)
+
+    assert len(second["tracks"]) == 2
+    assert second["duration"] == 12.5
+
+
+async def test_modified_file_is_probed_again(ffprobe, media_file):
+    await probe.probe_input_file(media_file)
+    with open(media_file, "ab") as f:
+        f.write(b"more")
+    os.utime(media_file, ns=(0, 1_000_000_000))
+
+    await probe.probe_input_file(media_file)
+
+    assert ffprobe.call_count == 2